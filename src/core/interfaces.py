@@ -5,7 +5,7 @@ The Core Logic layer codes against these interfaces, not the concrete implementa
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 
 class IConfigSerializer(ABC):
@@ -42,15 +42,18 @@ class IFileSystemAdapter(ABC):
     """Interface for file system operations."""
 
     @abstractmethod
-    async def file_exists(self, path: str) -> bool:
+    async def get_mtime(self, path: str) -> float:
         """
-        Check if a file exists at the given path.
+        Get the last modification time of a file.
 
         Args:
-            path: The file path to check
+            path: The file path to inspect
 
         Returns:
-            True if the file exists, False otherwise
+            The modification time in seconds since the epoch
+
+        Raises:
+            FileNotFoundError: If the file does not exist
         """
         pass
 
@@ -64,6 +67,26 @@ class IFileSystemAdapter(ABC):
 
         Returns:
             The file contents as a string
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        pass
+
+    @abstractmethod
+    async def read_files(self, paths: List[str]) -> List[Optional[bytes]]:
+        """
+        Read the raw contents of several files as a single batch.
+
+        The whole batch is read in one blocking call, so an implementation
+        needs a single executor hop rather than one per file.
+
+        Args:
+            paths: The file paths to read
+
+        Returns:
+            The file contents as bytes in the same order as paths, with None
+            for any file that could not be read
         """
         pass
 
@@ -79,19 +102,46 @@ class IFileSystemAdapter(ABC):
         pass
 
     @abstractmethod
-    async def find_files(self, pattern: str, root_dir: str) -> List[str]:
+    async def find_files(
+        self, pattern: str, root_dir: str, exclude_dirs: Optional[List[str]] = None
+    ) -> List[str]:
         """
         Find files matching a pattern within a root directory.
 
+        Discovery searches with find_files_multi; this single-pattern form
+        remains part of the public interface for other callers.
+
         Args:
             pattern: The glob pattern to match (e.g., "**/*.json")
             root_dir: The root directory to search from
+            exclude_dirs: Optional directory names (e.g., "node_modules") that
+                are not descended into while searching
 
         Returns:
             A list of file paths that match the pattern
         """
         pass
 
+    @abstractmethod
+    async def find_files_multi(
+        self, patterns: List[str], root_dir: str, exclude_dirs: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        Find files matching any of several patterns within a root directory.
+
+        Implementations should cover all patterns with as few directory walks
+        as possible rather than searching once per pattern.
+
+        Args:
+            patterns: The glob patterns to match (e.g., ["**/Makefile", "**/makefile"])
+            root_dir: The root directory to search from
+            exclude_dirs: Optional directory names that are not descended into
+
+        Returns:
+            A list of file paths matching at least one pattern, without duplicates
+        """
+        pass
+
 
 class IRunningProcess(ABC):
     """
@@ -99,6 +149,9 @@ class IRunningProcess(ABC):
     Provides methods to interact with and monitor the process.
 
     Note: Implementations must provide a 'pid' attribute (not necessarily a property).
+    Callbacks must be invoked on the event loop thread that started the process;
+    an implementation monitoring from another thread has to hand them over with
+    loop.call_soon_threadsafe.
     """
 
     # Note: pid is expected to be set as an instance attribute in __init__
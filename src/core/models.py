@@ -8,26 +8,26 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 import uuid
 
-@dataclass
+@dataclass(slots=True)
 class Target:
     """Represents a single executable command."""
     name: str
     command: str
     source_file: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
     notes: Optional[str] = None
     group_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TargetGroup:
     """Represents a user-defined group of targets."""
     name: str
     display_order: int
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectConfig:
     """Represents the entire project configuration, to be serialized."""
     project_name: str
@@ -1,179 +1,399 @@
 """
 This module implements the services for the Core Logic layer, as defined
 in the Detailed Design document.
+
+The services are plain coroutines with no event-loop specifics, so they run
+unmodified on the default asyncio loop or on uvloop.
 """
 import os
+import array
+import asyncio
 import json
-import threading
+import hashlib
+import functools
 import re
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from .interfaces import IFileSystemAdapter, IConfigSerializer, IShellAdapter
-from .models import ProjectConfig, Target
+from .models import ProjectConfig, Target, TargetGroup
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup; fall back to the stdlib parser
+    _json_loads = json.loads
+
+try:
+    import ijson
+    _JSON_ERRORS: Tuple[type, ...] = (ValueError, KeyError, ijson.JSONError)
+except ImportError:  # ijson is optional; large manifests are then parsed in full
+    ijson = None
+    _JSON_ERRORS = (ValueError, KeyError)
+
+CONFIG_FILE_NAME = ".project-dashboard.json"
+# Earlier releases stored the config as YAML; it is migrated on first load
+LEGACY_CONFIG_FILE_NAME = ".project-dashboard.yml"
+
+# Vendored and VCS directories that never contain project targets but can be
+# huge to walk. Output directories such as build/ are still searched, as they
+# may hold hand-written Makefiles or scripts.
+DISCOVERY_EXCLUDE_DIRS = ["node_modules", ".git", "__pycache__", ".venv"]
+
+# Every file kind discovery looks at; all are found in a single tree walk
+DISCOVERY_PATTERNS = ["**/package.json", "**/Makefile", "**/makefile", "**/*.sh", "**/*.py"]
+
+_PACKAGE_JSON_NAME = os.path.normcase("package.json")
+_MAKEFILE_NAMES = frozenset({os.path.normcase("Makefile"), os.path.normcase("makefile")})
+
+# Python package directories hold modules rather than runnable scripts
+PYTHON_PACKAGE_DIRS = frozenset({"src", "tests"})
+
+# Python files that are never standalone scripts
+SCRIPT_EXCLUDED_NAMES = frozenset({"setup.py", "__init__.py", "conftest.py"})
+
+# package.json files at least this large are stream-parsed for their scripts
+PACKAGE_JSON_STREAM_THRESHOLD = 8 * 1024
+
+# Makefile target pattern: target_name: [dependencies]
+# Matches lines like "build:", "test: build" or "docs.html: README", but not
+# ":=" / "::=" variable assignments. Names starting with "." are never
+# matched: they are special targets (".PHONY") or old-style suffix rules
+# (".c.o"), not something to run. Compiled once, over bytes, so Makefile
+# contents never need decoding.
+_MAKE_TARGET_RE = re.compile(rb'^([a-zA-Z0-9_-][a-zA-Z0-9_.-]*)\s*:(?!:?=)', re.MULTILINE)
+
 
-CONFIG_FILE_NAME = ".project-dashboard.yml"
+@functools.lru_cache(maxsize=64)
+def _config_path(project_root: str) -> str:
+    """Return the config file path for a project root."""
+    return os.path.join(project_root, CONFIG_FILE_NAME)
+
+
+def _config_from_data(config_data: Dict[str, Any]) -> ProjectConfig:
+    """Build a ProjectConfig from deserialized data, restoring nested models."""
+    data = dict(config_data)
+    data['targets'] = [
+        t if isinstance(t, Target) else Target(**t) for t in data.get('targets') or []
+    ]
+    data['groups'] = [
+        g if isinstance(g, TargetGroup) else TargetGroup(**g) for g in data.get('groups') or []
+    ]
+    return ProjectConfig(**data)
+
+
+def _package_json_script_names(content: bytes) -> List[str]:
+    """
+    Return the script names declared in a package.json file's content.
+
+    Large manifests are mostly dependency listings. When the top-level
+    "scripts" key appears in their first half, as npm's canonical field order
+    places it, they are stream-parsed with ijson and parsing stops as soon as
+    the scripts object closes, so the rest of such a file is not validated.
+    Every other manifest, including one without a "scripts" key, is parsed
+    in full.
+
+    Raises:
+        ValueError: If the content is not valid JSON (or ijson.JSONError when
+            stream-parsing), or if it or its "scripts" value is not an object
+    """
+    if ijson is not None and len(content) >= PACKAGE_JSON_STREAM_THRESHOLD:
+        scripts_at = content.find(b'"scripts"')
+        if 0 <= scripts_at < len(content) // 2:
+            names = []
+            # A small buffer lets the early break skip most of the file
+            events = ijson.parse(content, buf_size=4096)
+            if next(events, (None, None, None))[1] != "start_map":
+                raise ValueError("package.json is not a JSON object")
+            for prefix, event, value in events:
+                if prefix == "scripts":
+                    if event == "map_key":
+                        names.append(value)
+                    elif event == "end_map":
+                        break
+                    elif event != "start_map":
+                        raise ValueError('package.json "scripts" is not an object')
+            return names
+
+    data = _json_loads(content)
+    if not isinstance(data, dict):
+        raise ValueError("package.json is not a JSON object")
+    scripts = data.get("scripts", {})
+    if not isinstance(scripts, dict):
+        raise ValueError('package.json "scripts" is not an object')
+    return list(scripts)
+
+
+def _content_hash(content: str) -> bytes:
+    """Return a short digest identifying a config file's content."""
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
 
 
 class ConfigurationService:
-    """Manages the loading and saving of the ProjectConfig."""
+    """
+    Manages the loading and saving of the ProjectConfig.
+
+    When a legacy serializer is given and only a legacy YAML config exists, it
+    is loaded with that serializer and re-saved in the current format.
+
+    Within a session, loaded configs are additionally memoized per config path
+    together with the file's mtime and a hash of its content. An unchanged
+    mtime returns the memoized ProjectConfig after a single stat; a touched
+    file with identical content costs one read and hash, but no parse.
+    """
 
     def __init__(
         self,
         fs_adapter: IFileSystemAdapter,
         serializer: IConfigSerializer,
+        legacy_serializer: Optional[IConfigSerializer] = None,
     ):
         self._fs_adapter = fs_adapter
         self._serializer = serializer
+        self._legacy_serializer = legacy_serializer
+        self._cache: Dict[str, Tuple[float, bytes, ProjectConfig]] = {}
 
     async def load_config(self, project_root: str) -> Optional[ProjectConfig]:
-        config_path = os.path.join(project_root, CONFIG_FILE_NAME)
-        if not await self._fs_adapter.file_exists(config_path):
+        config_path = _config_path(project_root)
+        # The mtime stat doubles as the existence check
+        try:
+            config_mtime = await self._fs_adapter.get_mtime(config_path)
+        except FileNotFoundError:
+            return await self._migrate_legacy_config(project_root)
+
+        cached = self._cache.get(config_path)
+        if cached is not None and cached[0] == config_mtime:
+            return cached[2]
+
+        try:
+            file_content = await self._fs_adapter.read_file(config_path)
+        except FileNotFoundError:
+            # Removed since the stat above
+            self._cache.pop(config_path, None)
             return None
+        content_hash = _content_hash(file_content)
+        if cached is not None and cached[1] == content_hash:
+            self._cache[config_path] = (config_mtime, content_hash, cached[2])
+            return cached[2]
 
-        file_content = await self._fs_adapter.read_file(config_path)
-        config_data = self._serializer.deserialize(file_content)
-        return ProjectConfig(**config_data)
+        config = _config_from_data(self._serializer.deserialize(file_content))
+        self._cache[config_path] = (config_mtime, content_hash, config)
+        return config
 
 
     async def save_config(self, project_root: str, config: ProjectConfig) -> None:
-        config_path = os.path.join(project_root, CONFIG_FILE_NAME)
+        config_path = _config_path(project_root)
         serialized_data = self._serializer.serialize(config)
         await self._fs_adapter.write_file(config_path, serialized_data)
+        config_mtime = await self._fs_adapter.get_mtime(config_path)
+        self._cache[config_path] = (config_mtime, _content_hash(serialized_data), config)
+
+    def invalidate(self, project_root: str) -> None:
+        """
+        Forget the memoized config for a project.
+
+        Needed only when the config may have changed without its mtime
+        advancing, e.g. on filesystems with coarse timestamps.
+        """
+        config_path = _config_path(project_root)
+        self._cache.pop(config_path, None)
+
+    async def _migrate_legacy_config(self, project_root: str) -> Optional[ProjectConfig]:
+        """Load a legacy YAML config, if present, and re-save it in the current format."""
+        if self._legacy_serializer is None:
+            return None
+
+        legacy_path = os.path.join(project_root, LEGACY_CONFIG_FILE_NAME)
+        try:
+            legacy_content = await self._fs_adapter.read_file(legacy_path)
+        except FileNotFoundError:
+            return None
+
+        # YAML parsing is slow enough to stall the UI, so it runs off the loop
+        config_data = await asyncio.to_thread(self._legacy_serializer.deserialize, legacy_content)
+        config = _config_from_data(config_data)
+        await self.save_config(project_root, config)
+        return config
 
 
 class DiscoveryService:
-    """Scans for and parses potential targets from build artifacts."""
+    """
+    Scans for and parses potential targets from build artifacts.
+
+    package.json files that fail to parse are remembered together with their
+    mtime, so later discovery runs skip them until the file is modified.
+    """
 
     def __init__(self, fs_adapter: IFileSystemAdapter):
         self._fs_adapter = fs_adapter
+        self._bad_files: Dict[str, float] = {}
 
     async def discover_targets(self, project_root: str) -> List[Target]:
-        # Discover from all supported sources
-        package_json_targets = await self._discover_from_package_json(project_root)
-        makefile_targets = await self._discover_from_makefiles(project_root)
-        script_targets = await self._discover_from_scripts(project_root)
+        # Walk the tree once for every source, then split the hits by file name
+        found_files = await self._fs_adapter.find_files_multi(
+            DISCOVERY_PATTERNS, project_root, exclude_dirs=DISCOVERY_EXCLUDE_DIRS
+        )
+        package_json_files = []
+        makefile_files = []
+        script_files = []
+        for path in found_files:
+            name = os.path.normcase(os.path.basename(path))
+            if name == _PACKAGE_JSON_NAME:
+                package_json_files.append(path)
+            elif name in _MAKEFILE_NAMES:
+                makefile_files.append(path)
+            else:
+                script_files.append(path)
+
+        # Read and parse each source concurrently; they are independent
+        package_json_targets, makefile_targets, script_targets = await asyncio.gather(
+            self._discover_from_package_json(package_json_files),
+            self._discover_from_makefiles(makefile_files),
+            self._discover_from_scripts(project_root, script_files),
+        )
 
         # Combine all targets
         all_targets = package_json_targets + makefile_targets + script_targets
         return all_targets
 
-    async def _discover_from_package_json(self, project_root: str) -> List[Target]:
-        targets = []
-        package_json_files = await self._fs_adapter.find_files(
-            "**/package.json", project_root
+    async def _discover_from_package_json(self, package_json_files: List[str]) -> List[Target]:
+        # Skip files already known to be malformed at their current mtime
+        mtimes = await asyncio.gather(
+            *[self._fs_adapter.get_mtime(p) for p in package_json_files],
+            return_exceptions=True,
         )
+        candidates = [
+            (path, mtime) for path, mtime in zip(package_json_files, mtimes)
+            if self._bad_files.get(path) != mtime
+        ]
+        candidate_paths = [path for path, _ in candidates]
+
+        # Read raw bytes in one batch; both JSON parsers accept bytes directly,
+        # so no UTF-8 decode to str is needed
+        contents = await self._fs_adapter.read_files(candidate_paths)
+
+        # Parse off the event loop; large monorepo manifests would otherwise block it
+        targets, bad_paths = await asyncio.to_thread(
+            self._parse_package_json_files, candidate_paths, contents
+        )
+
+        candidate_mtimes = dict(candidates)
+        for path in bad_paths:
+            mtime = candidate_mtimes[path]
+            if not isinstance(mtime, BaseException):
+                self._bad_files[path] = mtime
+        return targets
+
+    @staticmethod
+    def _parse_package_json_files(
+        file_paths: List[str], contents: List[Optional[bytes]]
+    ) -> Tuple[List[Target], List[str]]:
+        """
+        Build npm targets from the contents of the given package.json files.
+
+        Targets are deduplicated by (name, command): every npm target runs from
+        the project root, so workspaces repeating a script name would otherwise
+        yield identical entries. The first file declaring a script wins.
 
-        for file_path in package_json_files:
+        Returns:
+            The discovered targets and the paths of files that failed to parse
+        """
+        targets: Dict[Tuple[str, str], Target] = {}
+        bad_paths = []
+        for file_path, content in zip(file_paths, contents):
+            if content is None:
+                continue
             try:
-                content = await self._fs_adapter.read_file(file_path)
-                data = json.loads(content)
-                scripts = data.get("scripts", {})
-                for name, command in scripts.items():
-                    targets.append(
-                        Target(
+                for name in _package_json_script_names(content):
+                    command = "npm run " + name
+                    key = (name, command)
+                    if key not in targets:
+                        targets[key] = Target(
                             name=name,
-                            command=f"npm run {name}",
+                            command=command,
                             source_file=file_path,
                         )
-                    )
-            except (json.JSONDecodeError, KeyError):
-                continue
-        return targets
+            except _JSON_ERRORS:
+                # Covers json, orjson and ijson decode errors
+                bad_paths.append(file_path)
+        return list(targets.values()), bad_paths
 
-    async def _discover_from_makefiles(self, project_root: str) -> List[Target]:
+    async def _discover_from_makefiles(self, makefile_files: List[str]) -> List[Target]:
         """
         Discover targets from Makefile and makefile files.
 
-        Parses make targets from Makefiles found in the project.
+        Parses make targets from the given Makefiles.
         """
-        targets = []
+        # Read every Makefile in one batch rather than awaiting each in turn
+        contents = await self._fs_adapter.read_files(makefile_files)
 
-        # Find both Makefile and makefile
-        makefile_files = []
-        for pattern in ["**/Makefile", "**/makefile"]:
-            files = await self._fs_adapter.find_files(pattern, project_root)
-            makefile_files.extend(files)
-
-        # Remove duplicates
-        makefile_files = list(set(makefile_files))
+        # Parse off the event loop, like package.json files
+        return await asyncio.to_thread(self._parse_makefiles, makefile_files, contents)
 
-        for file_path in makefile_files:
-            try:
-                content = await self._fs_adapter.read_file(file_path)
-
-                # Parse Makefile targets
-                # Target pattern: target_name: [dependencies]
-                # Matches lines like: "build:", "test: build", etc.
-                target_pattern = re.compile(r'^([a-zA-Z0-9_-]+)\s*:', re.MULTILINE)
-
-                for match in target_pattern.finditer(content):
-                    target_name = match.group(1)
-
-                    # Skip special make directives
-                    if target_name.startswith('.') and target_name.upper() == target_name:
-                        continue  # Skip .PHONY, .DEFAULT, etc.
+    @staticmethod
+    def _parse_makefiles(
+        file_paths: List[str], contents: List[Optional[bytes]]
+    ) -> List[Target]:
+        """Build make targets from the contents of the given Makefiles."""
+        targets = []
+        for file_path, raw_content in zip(file_paths, contents):
+            if raw_content is None:
+                continue
 
-                    targets.append(
-                        Target(
-                            name=target_name,
-                            command=f"make {target_name}",
-                            source_file=file_path,
-                        )
+            for match in _MAKE_TARGET_RE.finditer(raw_content):
+                # The pattern only matches ASCII, so this decode cannot fail
+                target_name = match.group(1).decode('ascii')
+                targets.append(
+                    Target(
+                        name=target_name,
+                        command=f"make {target_name}",
+                        source_file=file_path,
                     )
-            except Exception:
-                # Silently skip malformed Makefiles
-                continue
+                )
 
         return targets
 
-    async def _discover_from_scripts(self, project_root: str) -> List[Target]:
+    async def _discover_from_scripts(self, project_root: str, script_files: List[str]) -> List[Target]:
         """
         Discover executable scripts (shell and Python).
 
-        Finds .sh and .py files and creates targets that can be executed.
-        Excludes common non-script files like setup.py, __init__.py, etc.
+        Creates targets that can be executed from the given .sh and .py files,
+        classified by extension. Excludes common non-script files like
+        setup.py, __init__.py, etc.
 
         Args:
             project_root: The root directory of the project
+            script_files: Paths of the .sh and .py files found in the project
 
         Returns:
             List of Target objects representing executable scripts
         """
-        targets = []
+        shell_targets = []
+        python_targets = []
 
-        # Files to exclude from script discovery
-        excluded_patterns = [
-            'setup.py',
-            '__init__.py',
-            'conftest.py',
-        ]
-
-        # Discover shell scripts (.sh files)
-        shell_scripts = await self._fs_adapter.find_files("**/*.sh", project_root)
-        for script_path in shell_scripts:
+        for script_path in script_files:
             script_name = os.path.basename(script_path)
-            targets.append(
-                Target(
-                    name=script_name,
-                    command=f"bash {script_path}",
-                    source_file=script_path,
-                )
-            )
 
-        # Discover Python scripts (.py files)
-        python_scripts = await self._fs_adapter.find_files("**/*.py", project_root)
-        for script_path in python_scripts:
-            script_name = os.path.basename(script_path)
+            if script_name.endswith('.sh'):
+                shell_targets.append(
+                    Target(
+                        name=script_name,
+                        command=f"bash {script_path}",
+                        source_file=script_path,
+                    )
+                )
+                continue
 
             # Skip excluded files
-            if script_name in excluded_patterns:
+            if script_name in SCRIPT_EXCLUDED_NAMES:
                 continue
 
-            # Skip files in common Python package directories
-            if '/src/' in script_path or '/tests/' in script_path or '/__pycache__/' in script_path:
+            # Skip modules inside Python package directories; shell scripts
+            # there are still discovered, so these are not pruned from the walk
+            rel_dir = os.path.relpath(os.path.dirname(script_path), project_root)
+            if PYTHON_PACKAGE_DIRS.intersection(rel_dir.split(os.sep)):
                 continue
 
-            targets.append(
+            python_targets.append(
                 Target(
                     name=script_name,
                     command=f"python {script_path}",
@@ -181,40 +401,57 @@ class DiscoveryService:
                 )
             )
 
-        return targets
+        return shell_targets + python_targets
 
 
 class ExecutionService:
-    """Manages the execution of targets."""
+    """
+    Manages the execution of targets.
+
+    All state is confined to the event loop thread: run_target and
+    cancel_target run on the loop, and IRunningProcess guarantees that close
+    callbacks are delivered there too, so no lock is needed. Running pids are
+    mirrored in a contiguous array so snapshots copy from a C buffer; each
+    pid's slot in it is indexed so a closing process is swap-removed in O(1).
+    """
 
     def __init__(self, shell_adapter: IShellAdapter):
         self._shell_adapter = shell_adapter
         self._running_processes: Dict[int, Any] = {}
-        self._lock = threading.Lock()
-
-    async def run_target(self, target: Target, project_root: str, shell: str) -> int:
-        process = await self._shell_adapter.execute(target.command, project_root, shell)
-        with self._lock:
-            self._running_processes[process.pid] = process
-
-        def on_close(pid_to_remove: int):
-            with self._lock:
-                if pid_to_remove in self._running_processes:
-                    del self._running_processes[pid_to_remove]
-
-        process.set_on_close(lambda code: on_close(process.pid))
+        self._pids = array.array('q')
+        self._pid_slots: Dict[int, int] = {}
+
+    async def run_target(
+        self, target: Target, project_root: str, shell: Optional[str] = None
+    ) -> int:
+        # Asked per run; the adapter caches its shell detection
+        process = await self._shell_adapter.execute(
+            target.command, project_root, shell or self._shell_adapter.get_system_shell()
+        )
+        if process.pid not in self._pid_slots:
+            self._pid_slots[process.pid] = len(self._pids)
+            self._pids.append(process.pid)
+        self._running_processes[process.pid] = process
+        process.set_on_close(functools.partial(self._on_process_close, process.pid))
         return process.pid
 
-    def cancel_target(self, pid: int) -> None:
-        with self._lock:
-            process = self._running_processes.get(pid)
+    def _on_process_close(self, pid: int, exit_code: int) -> None:
+        if self._running_processes.pop(pid, None) is None:
+            return
+        # Move the last pid into the freed slot instead of shifting the tail
+        slot = self._pid_slots.pop(pid)
+        last_pid = self._pids.pop()
+        if last_pid != pid:
+            self._pids[slot] = last_pid
+            self._pid_slots[last_pid] = slot
 
+    def cancel_target(self, pid: int) -> None:
+        process = self._running_processes.get(pid)
         if process:
             process.kill()
 
     def get_running_processes(self) -> List[int]:
-        with self._lock:
-            return list(self._running_processes.keys())
+        return self._pids.tolist()
 
 
 class ProjectService:
@@ -234,13 +471,14 @@ class ProjectService:
         self._execution_service = execution_service
         self._project_root: Optional[str] = None
         self._config: Optional[ProjectConfig] = None
+        self._targets_by_id: Dict[str, Target] = {}
 
     async def load_project(self, project_root: str) -> Optional[ProjectConfig]:
         self._project_root = project_root
         config = await self._config_service.load_config(project_root)
 
         if config:
-            self._config = config
+            self._set_config(config)
         else:
             discovered_targets = await self._discovery_service.discover_targets(
                 project_root
@@ -250,21 +488,27 @@ class ProjectService:
                 project_name=project_name, targets=discovered_targets
             )
             await self._config_service.save_config(project_root, new_config)
-            self._config = new_config
+            self._set_config(new_config)
 
         return self._config
 
+    def _set_config(self, config: ProjectConfig) -> None:
+        """Make a config current and rebuild the target-by-id index for it."""
+        self._config = config
+        self._targets_by_id = {t.id: t for t in config.targets}
+
     async def run_target(self, target_id: str) -> int:
         if not self._config or not self._project_root:
             raise ValueError("Project not loaded.")
 
-        target_to_run = next((t for t in self._config.targets if t.id == target_id), None)
+        target_to_run = self._targets_by_id.get(target_id)
 
         if not target_to_run:
             raise ValueError(f"Target with ID '{target_id}' not found.")
 
-        shell = self._config.shell or self._execution_service._shell_adapter.get_system_shell()
-        return await self._execution_service.run_target(target_to_run, self._project_root, shell)
+        return await self._execution_service.run_target(
+            target_to_run, self._project_root, self._config.shell
+        )
 
     def cancel_target(self, pid: int):
         self._execution_service.cancel_target(pid)
@@ -2,48 +2,286 @@
 This module provides the concrete implementations of the infrastructure interfaces.
 """
 import os
+import re
 import glob
-import yaml
-import aiofiles
+import fnmatch
 import asyncio
+import functools
 import shutil
-from typing import Any, List, Callable
+import codecs
+import json
+from dataclasses import asdict
+from typing import Any, List, Optional, Callable, FrozenSet, Pattern, Tuple
 
 from src.core.interfaces import IConfigSerializer, IFileSystemAdapter, IRunningProcess, IShellAdapter
 from src.core.models import ProjectConfig
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to the stdlib codec
+    orjson = None
+
+# Subprocess output is read in chunks of up to this many bytes
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_codec() -> Tuple[Any, type, type]:
+    """
+    Return PyYAML with its safe loader and dumper, resolved once per process.
+
+    The LibYAML C classes are used when available, falling back to the
+    pure-Python safe implementations otherwise. PyYAML is imported on first
+    use rather than with this module, as YAML is only needed to migrate
+    legacy configs.
+    """
+    import yaml
+    return (
+        yaml,
+        getattr(yaml, 'CSafeLoader', yaml.SafeLoader),
+        getattr(yaml, 'CSafeDumper', yaml.SafeDumper),
+    )
+
 
 class YamlConfigSerializer(IConfigSerializer):
     """A serializer that uses the PyYAML library."""
 
+    def __init__(self):
+        self._yaml, self._loader, self._dumper = _yaml_codec()
+
+    def serialize(self, config: ProjectConfig) -> str:
+        return self._yaml.dump(asdict(config), Dumper=self._dumper, sort_keys=False)
+
+    def deserialize(self, data: str) -> Any:
+        return self._yaml.load(data, Loader=self._loader)
+
+
+class OrjsonConfigSerializer(IConfigSerializer):
+    """
+    A serializer that writes the config as indented JSON using orjson.
+
+    Without orjson the stdlib json module produces the same output.
+    """
+
     def serialize(self, config: ProjectConfig) -> str:
-        from dataclasses import asdict
-        return yaml.dump(asdict(config), sort_keys=False)
+        if orjson is None:
+            return json.dumps(asdict(config), indent=2, ensure_ascii=False)
+        return orjson.dumps(asdict(config), option=orjson.OPT_INDENT_2).decode('utf-8')
 
     def deserialize(self, data: str) -> Any:
-        return yaml.safe_load(data)
+        if orjson is None:
+            return json.loads(data)
+        return orjson.loads(data)
 
 
 class AioFileSystemAdapter(IFileSystemAdapter):
-    """An adapter for file system operations using aiofiles."""
+    """
+    An adapter for file system operations.
 
-    async def file_exists(self, path: str) -> bool:
-        return await asyncio.to_thread(os.path.exists, path)
+    Each operation runs plain blocking I/O in a single asyncio.to_thread hop,
+    which is cheaper than aiofiles' separate executor round-trips per call.
+    That includes get_mtime, as a stat on a slow or network filesystem would
+    otherwise stall the event loop.
+    """
+
+    async def get_mtime(self, path: str) -> float:
+        return (await asyncio.to_thread(os.stat, path)).st_mtime
 
     async def read_file(self, path: str) -> str:
-        async with aiofiles.open(path, mode='r', encoding='utf-8') as f:
-            return await f.read()
+        return await asyncio.to_thread(self._sync_read, path)
+
+    async def read_files(self, paths: List[str]) -> List[Optional[bytes]]:
+        # One executor hop for the whole batch instead of one per file
+        return await asyncio.to_thread(_read_all_bytes, paths)
 
     async def write_file(self, path: str, content: str) -> None:
-        async with aiofiles.open(path, mode='w', encoding='utf-8') as f:
-            await f.write(content)
+        await asyncio.to_thread(self._sync_write, path, content)
+
+    async def find_files(
+        self, pattern: str, root_dir: str, exclude_dirs: Optional[List[str]] = None
+    ) -> List[str]:
+        return await asyncio.to_thread(
+            _find_files, [pattern], root_dir, frozenset(exclude_dirs or ())
+        )
+
+    async def find_files_multi(
+        self, patterns: List[str], root_dir: str, exclude_dirs: Optional[List[str]] = None
+    ) -> List[str]:
+        return await asyncio.to_thread(
+            _find_files, patterns, root_dir, frozenset(exclude_dirs or ())
+        )
+
+    @staticmethod
+    def _sync_read(path: str) -> str:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    @staticmethod
+    def _sync_write(path: str, content: str) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+
+def _read_bytes(path: str) -> bytes:
+    """
+    Read a file's raw bytes, sized from fstat so most files take a single
+    os.read call.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while True:
+            chunk = os.read(fd, max(size, 1))
+            if not chunk:
+                return b''.join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+def _read_all_bytes(paths: List[str]) -> List[Optional[bytes]]:
+    """Read several files sequentially, yielding None for any that fail."""
+    contents: List[Optional[bytes]] = []
+    for path in paths:
+        try:
+            contents.append(_read_bytes(path))
+        except OSError:
+            contents.append(None)
+    return contents
 
-    async def find_files(self, pattern: str, root_dir: str) -> List[str]:
-        return await asyncio.to_thread(glob.glob, os.path.join(root_dir, pattern), recursive=True)
+
+def _find_files(patterns: List[str], root_dir: str, exclude_dirs: FrozenSet[str]) -> List[str]:
+    """
+    Find files matching any of patterns without descending into excluded directories.
+
+    All recursive basename patterns such as "**/package.json" or "**/*.sh" are
+    matched together during a single os.scandir walk that prunes excluded
+    directories before entering them. Shallow patterns such as "*.sh" are
+    matched with a single os.scandir of root_dir. Any other pattern falls back
+    to glob and drops excluded paths after the fact. Hidden entries are
+    skipped as glob would, and every file is returned once, in scan order.
+    """
+    name_patterns = []
+    shallow_patterns = []
+    globbed = []
+    for pattern in patterns:
+        prefix, _, name_pattern = pattern.rpartition('/')
+        if prefix == '**':
+            name_patterns.append(name_pattern)
+        elif not prefix:
+            shallow_patterns.append(name_pattern)
+        else:
+            globbed.extend(_glob_excluding(pattern, root_dir, exclude_dirs))
+
+    sources = [globbed] if globbed else []
+    if shallow_patterns:
+        sources.append(_walk_matching(root_dir, shallow_patterns, exclude_dirs, recursive=False))
+    if name_patterns:
+        sources.append(_walk_matching(root_dir, name_patterns, exclude_dirs))
+
+    if len(sources) == 1 and not globbed:
+        # A scan tests each directory entry once and never follows
+        # symlinks, so its results are already unique
+        return sources[0]
+    return _dedupe_paths([path for source in sources for path in source])
+
+
+def _dedupe_paths(paths: List[str]) -> List[str]:
+    """
+    Drop paths that refer to a file already seen, keeping the first spelling.
+
+    Paths are compared after resolving symlinks and normalizing case, so
+    symlinked directories and case-insensitive filesystems yield each file once.
+    """
+    unique = {}
+    for path in paths:
+        unique.setdefault(os.path.normcase(os.path.realpath(path)), path)
+    return list(unique.values())
+
+
+def _glob_excluding(pattern: str, root_dir: str, exclude_dirs: FrozenSet[str]) -> List[str]:
+    """Run glob for pattern and drop results inside excluded directories."""
+    matches = glob.glob(os.path.join(root_dir, pattern), recursive=True)
+    if not exclude_dirs:
+        return matches
+    return [
+        path for path in matches
+        if not exclude_dirs.intersection(os.path.relpath(path, root_dir).split(os.sep)[:-1])
+    ]
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_name_patterns(
+    name_patterns: Tuple[str, ...]
+) -> Tuple[FrozenSet[str], Optional[Pattern], Optional[Pattern]]:
+    """
+    Compile basename patterns into literal names plus two combined regexes.
+
+    The first regex matches any wildcard pattern and is used for visible
+    names; the second only holds patterns that start with a dot, as glob
+    matches hidden names against those alone. Names are normcased before
+    matching, as fnmatch does.
+    """
+    literal_names = frozenset(os.path.normcase(p) for p in name_patterns if not glob.has_magic(p))
+    wildcard_patterns = [os.path.normcase(p) for p in name_patterns if glob.has_magic(p)]
+
+    def combine(patterns: List[str]) -> Optional[Pattern]:
+        if not patterns:
+            return None
+        return re.compile('|'.join(fnmatch.translate(p) for p in patterns))
+
+    return (
+        literal_names,
+        combine(wildcard_patterns),
+        combine([p for p in wildcard_patterns if p.startswith('.')]),
+    )
+
+
+def _walk_matching(
+    root_dir: str, name_patterns: List[str], exclude_dirs: FrozenSet[str], recursive: bool = True
+) -> List[str]:
+    """
+    Walk root_dir once, collecting files whose basename matches a name pattern.
+
+    Entry types come from the d_type that os.scandir reads with the directory,
+    so no per-entry stat is needed on Linux and BSD. Literal names are compared
+    directly, and all wildcard patterns are tried with one precompiled regex.
+    With recursive=False only root_dir itself is scanned.
+    """
+    literal_names, visible_re, hidden_re = _compile_name_patterns(tuple(name_patterns))
+
+    def matches_name(name: str) -> bool:
+        name = os.path.normcase(name)
+        if name in literal_names:
+            return True
+        pattern_re = hidden_re if name.startswith('.') else visible_re
+        return pattern_re is not None and pattern_re.match(name) is not None
+
+    results = []
+    pending = [root_dir]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive and entry.name not in exclude_dirs and not entry.name.startswith('.'):
+                            pending.append(entry.path)
+                    elif matches_name(entry.name):
+                        results.append(entry.path)
+        except OSError:
+            # Unreadable directories are skipped, as glob does
+            continue
+    return results
 
 
 class AsyncioRunningProcess(IRunningProcess):
-    """An implementation of IRunningProcess using asyncio.subprocess."""
+    """
+    An implementation of IRunningProcess using asyncio.subprocess.
+
+    Callbacks are invoked from a task on the loop that spawned the process.
+    """
 
     def __init__(self, process: asyncio.subprocess.Process):
         self._process = process
@@ -66,14 +304,34 @@ class AsyncioRunningProcess(IRunningProcess):
 
 
 class AsyncioShellAdapter(IShellAdapter):
-    """An adapter for shell command execution using asyncio."""
+    """
+    An adapter for shell command execution using asyncio.
+
+    The system shell is resolved once and cached, since SHELL and PATH do not
+    change during the app's lifetime.
+    """
+
+    def __init__(self):
+        self._cached_shell: Optional[str] = None
 
     async def _stream_reader(self, stream: asyncio.StreamReader, on_data: Callable[[str], None]):
-        """Helper to read lines from a stream and invoke a callback."""
-        while not stream.at_eof():
-            line = await stream.readline()
-            if line:
-                on_data(line.decode('utf-8'))
+        """
+        Helper to read a stream in chunks and invoke a callback with the text.
+
+        An incremental decoder carries multi-byte characters split across
+        chunk boundaries over to the next chunk; invalid bytes are replaced.
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        while True:
+            chunk = await stream.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            text = decoder.decode(chunk)
+            if text:
+                on_data(text)
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            on_data(tail)
 
     async def execute(self, command: str, working_dir: str, shell: str) -> IRunningProcess:
         process = await asyncio.create_subprocess_shell(
@@ -106,6 +364,16 @@ class AsyncioShellAdapter(IShellAdapter):
         return running_process
 
     def get_system_shell(self) -> str:
+        if self._cached_shell is None:
+            self._cached_shell = self._resolve_system_shell()
+        return self._cached_shell
+
+    def invalidate_shell_cache(self) -> None:
+        """Forget the cached shell so the next lookup resolves it again."""
+        self._cached_shell = None
+
+    @staticmethod
+    def _resolve_system_shell() -> str:
         shell_path = os.environ.get("SHELL")
         if shell_path and os.path.exists(shell_path):
             return shell_path
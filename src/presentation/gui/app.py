@@ -4,9 +4,13 @@ Application entry point for the Project Dashboard GUI.
 This module creates and configures the wxPython application, sets up
 dependency injection for all services, and launches the main window.
 """
+import os
 import wx
 import asyncio
+import concurrent.futures
+from functools import cached_property
 from src.infrastructure.adapters import (
+    OrjsonConfigSerializer,
     YamlConfigSerializer,
     AioFileSystemAdapter,
     AsyncioShellAdapter
@@ -20,17 +24,30 @@ from src.core.services import (
 from src.presentation.gui.presenters.main_presenter import MainPresenter
 from src.presentation.gui.views.main_view import MainView
 
+# Intervals, in milliseconds, at which asyncio work is processed while tasks
+# are in flight and while the loop is idle
+ASYNC_BUSY_TICK_MS = 5
+ASYNC_IDLE_TICK_MS = 100
+
+# Worker threads for blocking file I/O; discovery issues many reads at once,
+# so this is sized for I/O concurrency rather than CPU count
+IO_EXECUTOR_WORKERS = 64
+
 
 class DashboardApp(wx.App):
     """
     Main application class for Project Dashboard.
 
     This class:
-    1. Sets up all infrastructure adapters
-    2. Initializes core services with dependency injection
-    3. Creates the presenter and view (MVP pattern)
-    4. Configures the asyncio event loop for async operations
-    5. Shows the main window
+    1. Configures the asyncio event loop for async operations
+    2. Creates the presenter and view (MVP pattern)
+    3. Shows the main window
+    4. Wires the core services into the presenter once the window is up
+
+    Adapters and services are cached properties whose modules are imported
+    with this one. OnInit only shows the window; the services are built by a
+    wx.CallAfter once the main loop starts. Until then the presenter treats
+    the project as not loaded.
     """
 
     def OnInit(self):
@@ -38,7 +55,7 @@ class DashboardApp(wx.App):
         Initialize the application.
 
         This method is called by wxPython during app startup.
-        It sets up all services and creates the main window.
+        It creates and shows the main window, deferring service setup.
 
         Returns:
             True if initialization was successful, False otherwise
@@ -46,28 +63,9 @@ class DashboardApp(wx.App):
         # Setup asyncio event loop
         self._setup_event_loop()
 
-        # Initialize infrastructure adapters
-        self.fs_adapter = AioFileSystemAdapter()
-        self.shell_adapter = AsyncioShellAdapter()
-        self.serializer = YamlConfigSerializer()
-
-        # Initialize core services
-        self.config_service = ConfigurationService(
-            self.fs_adapter,
-            self.serializer
-        )
-        self.discovery_service = DiscoveryService(self.fs_adapter)
-        self.execution_service = ExecutionService(self.shell_adapter)
-
-        # Initialize project service (facade)
-        self.project_service = ProjectService(
-            self.config_service,
-            self.discovery_service,
-            self.execution_service
-        )
-
-        # Create presenter and view (MVP pattern)
-        self.presenter = MainPresenter(self.project_service, None)
+        # Create presenter and view (MVP pattern); the presenter gets its
+        # project service right after the window is shown
+        self.presenter = MainPresenter(None, None)
         self.main_view = MainView(self.presenter)
 
         # Connect presenter to view
@@ -76,33 +74,133 @@ class DashboardApp(wx.App):
         # Show the main window
         self.main_view.Show()
 
+        wx.CallAfter(self._attach_services)
+
         return True
 
+    def _attach_services(self):
+        """Build the services and hand the project service to the presenter."""
+        self.presenter.project_service = self.project_service
+
+    # Infrastructure adapters
+
+    @cached_property
+    def fs_adapter(self) -> AioFileSystemAdapter:
+        return AioFileSystemAdapter()
+
+    @cached_property
+    def shell_adapter(self) -> AsyncioShellAdapter:
+        return AsyncioShellAdapter()
+
+    @cached_property
+    def serializer(self) -> OrjsonConfigSerializer:
+        return OrjsonConfigSerializer()
+
+    # Core services
+
+    @cached_property
+    def config_service(self) -> ConfigurationService:
+        # Existing YAML configs are migrated to JSON on first load
+        return ConfigurationService(
+            self.fs_adapter,
+            self.serializer,
+            legacy_serializer=YamlConfigSerializer()
+        )
+
+    @cached_property
+    def discovery_service(self) -> DiscoveryService:
+        return DiscoveryService(self.fs_adapter)
+
+    @cached_property
+    def execution_service(self) -> ExecutionService:
+        return ExecutionService(self.shell_adapter)
+
+    @cached_property
+    def project_service(self) -> ProjectService:
+        # Facade over the other services
+        return ProjectService(
+            self.config_service,
+            self.discovery_service,
+            self.execution_service
+        )
+
     def _setup_event_loop(self):
         """
         Setup the asyncio event loop to work with wxPython.
 
         This integrates asyncio with wxPython's event loop so async operations
-        work correctly.
+        work correctly. On POSIX, uvloop is used for the loop when it is
+        installed.
         """
+        if os.name != 'nt':
+            try:
+                import uvloop
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            except ImportError:
+                pass
+
         # Create a new event loop for this thread
         self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
 
-        # Schedule periodic execution of asyncio tasks
+        # Every asyncio.to_thread call in the adapters runs on this executor
+        self.io_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=IO_EXECUTOR_WORKERS, thread_name_prefix='pd-io'
+        )
+        self.loop.set_default_executor(self.io_executor)
+
+        # Schedule periodic execution of asyncio tasks. The interval adapts
+        # to whether tasks are in flight, so an idle app rarely wakes up.
         self.timer = wx.Timer(self)
         self.Bind(wx.EVT_TIMER, self._run_async_tasks, self.timer)
-        self.timer.Start(10)  # Run every 10ms
+        self._tick_ms = ASYNC_IDLE_TICK_MS
+        self.timer.Start(self._tick_ms)
+
+        # wx sends idle events once it has handled a burst of user input, so
+        # coroutines scheduled by a menu or button handler start right away
+        # instead of waiting for the next idle tick
+        self.Bind(wx.EVT_IDLE, self._on_idle)
+
+    def OnExit(self):
+        """
+        Release the asyncio resources when the application exits.
+
+        Returns:
+            The application's exit code
+        """
+        self.timer.Stop()
+        self.io_executor.shutdown(wait=False, cancel_futures=True)
+        return super().OnExit()
+
+    def _on_idle(self, event):
+        """Run ready asyncio work when wx becomes idle."""
+        self._run_async_tasks(event)
+        event.Skip()
 
     def _run_async_tasks(self, event):
         """
         Run pending asyncio tasks.
 
-        Called periodically by wx.Timer to process asyncio coroutines.
+        Called by wx.Timer and on idle to process asyncio coroutines. The
+        stop is queued behind the callbacks that are already ready, so
+        run_forever processes them in a single pass and returns immediately
+        when the queue is empty. The timer then ticks every
+        ASYNC_BUSY_TICK_MS while tasks remain and every ASYNC_IDLE_TICK_MS
+        otherwise.
         """
-        self.loop.stop()
+        # A modal dialog opened from a coroutine runs a nested wx event loop
+        # that keeps delivering timer and idle events; the loop cannot re-enter
+        if self.loop.is_running():
+            return
+
+        self.loop.call_soon(self.loop.stop)
         self.loop.run_forever()
 
+        tick_ms = ASYNC_BUSY_TICK_MS if asyncio.all_tasks(self.loop) else ASYNC_IDLE_TICK_MS
+        if tick_ms != self._tick_ms:
+            self._tick_ms = tick_ms
+            self.timer.Start(tick_ms)
+
 
 def main():
     """
@@ -9,6 +9,9 @@ from typing import Optional, List
 from src.core.services import ProjectService
 from src.core.models import Target
 
+# Marks the cached project name as not yet fetched (None means "no project")
+_UNSET = object()
+
 
 class MainPresenter:
     """
@@ -19,18 +22,28 @@ class MainPresenter:
     - Handle user actions (load project, run targets, etc.)
     - Update the view based on service responses
     - Handle errors and display them to the user
+
+    The project name is cached on the presenter, as views query it from many
+    redraw and status paths. load_project refreshes the cache; anything else
+    that changes the config should call invalidate().
+
+    The project service may be attached after construction. Until it is, no
+    project is loaded and load_project only reports that it is unavailable.
     """
 
-    def __init__(self, project_service: ProjectService, view):
+    def __init__(self, project_service: Optional[ProjectService], view):
         """
         Initialize the MainPresenter.
 
         Args:
-            project_service: The ProjectService instance for core operations
-            view: The view interface (implements set_project_name, set_status, show_error)
+            project_service: The ProjectService instance for core operations,
+                or None if it is attached later
+            view: The view interface (implements set_project_name, set_status, show_error,
+                batch_updates)
         """
         self.project_service = project_service
         self.view = view
+        self._cached_name = _UNSET
 
     async def load_project(self, project_root: str) -> None:
         """
@@ -45,17 +58,26 @@ class MainPresenter:
         Args:
             project_root: The absolute path to the project root directory
         """
+        if self.project_service is None:
+            self.view.set_status("Still starting up; try again in a moment")
+            return
+
         try:
             # Load the project via the service
             config = await self.project_service.load_project(project_root)
+            self._cached_name = config.project_name if config else None
 
             # Update the view with the project name and targets
             if config:
-                self.view.set_project_name(config.project_name)
-                self.view.update_target_list(config.targets)
-                self.view.set_status(f"Project '{config.project_name}' loaded successfully")
+                with self.view.batch_updates():
+                    self.view.set_project_name(config.project_name)
+                    self.view.update_target_list(config.targets)
+                    self.view.set_status(f"Project '{config.project_name}' loaded successfully")
 
         except Exception as e:
+            # The service may have changed state before failing
+            self.invalidate()
+
             # Handle errors and display to user
             error_message = f"Failed to load project: {str(e)}"
             self.view.show_error(error_message)
@@ -67,10 +89,16 @@ class MainPresenter:
         Returns:
             The project name if a project is loaded, None otherwise
         """
-        config = self.project_service.get_config()
-        if config:
-            return config.project_name
-        return None
+        if self.project_service is None:
+            return None
+        if self._cached_name is _UNSET:
+            config = self.project_service.get_config()
+            self._cached_name = config.project_name if config else None
+        return self._cached_name
+
+    def invalidate(self) -> None:
+        """Drop cached project state so it is re-read from the service on next use."""
+        self._cached_name = _UNSET
 
     def get_targets(self) -> List[Target]:
         """
@@ -79,6 +107,8 @@ class MainPresenter:
         Returns:
             List of Target objects if a project is loaded, empty list otherwise
         """
+        if self.project_service is None:
+            return []
         config = self.project_service.get_config()
         if config:
             return config.targets
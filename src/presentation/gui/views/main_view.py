@@ -6,7 +6,8 @@ It is "dumb" and delegates all business logic to the MainPresenter.
 """
 import wx
 import asyncio
-from typing import TYPE_CHECKING, List, Optional
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator, List, Optional, Set, Tuple
 
 if TYPE_CHECKING:
     from src.presentation.gui.presenters.main_presenter import MainPresenter
@@ -14,6 +15,41 @@ if TYPE_CHECKING:
 from src.core.models import Target
 
 
+class TargetListCtrl(wx.ListCtrl):
+    """
+    A virtual report-mode list of targets.
+
+    Rows are not copied into the native control. Cell text is served on
+    demand from one list per column, so populating is O(1) in the number of
+    targets and only visible rows are ever materialized.
+    """
+
+    def __init__(self, parent: wx.Window):
+        super().__init__(parent, style=wx.LC_REPORT | wx.LC_VIRTUAL | wx.LC_SINGLE_SEL)
+        self._columns: Tuple[List[str], List[str], List[str]] = ([], [], [])
+
+    def set_targets(self, targets: List[Target]) -> None:
+        """
+        Replace the displayed targets.
+
+        Args:
+            targets: List of Target objects to display
+        """
+        self._columns = (
+            [t.name for t in targets],
+            [t.command for t in targets],
+            [t.source_file for t in targets],
+        )
+        # Clears the selection along with the old rows
+        self.DeleteAllItems()
+        self.SetItemCount(len(targets))
+        if targets:
+            self.RefreshItems(0, len(targets) - 1)
+
+    def OnGetItemText(self, item: int, column: int) -> str:
+        return self._columns[column][item]
+
+
 class MainView(wx.Frame):
     """
     Main application window using wxPython.
@@ -22,6 +58,7 @@ class MainView(wx.Frame):
     - set_project_name(name: str) -> None
     - set_status(message: str) -> None
     - show_error(message: str) -> None
+    - batch_updates() -> context manager
 
     The view is responsible only for displaying information and
     forwarding user actions to the presenter.
@@ -46,6 +83,10 @@ class MainView(wx.Frame):
         # Store targets for selection tracking
         self._targets: List[Target] = []
 
+        # The loop only holds weak references to tasks, so keep scheduled
+        # presenter calls alive until they finish
+        self._pending_tasks: Set[asyncio.Task] = set()
+
         # Create UI components
         self._create_menu_bar()
         self._create_main_panel()
@@ -86,10 +127,7 @@ class MainView(wx.Frame):
         sizer = wx.BoxSizer(wx.VERTICAL)
 
         # Create target list control
-        self.target_list = wx.ListCtrl(
-            panel,
-            style=wx.LC_REPORT | wx.LC_SINGLE_SEL
-        )
+        self.target_list = TargetListCtrl(panel)
 
         # Add columns
         self.target_list.AppendColumn("Name", width=150)
@@ -121,9 +159,10 @@ class MainView(wx.Frame):
 
         if dialog.ShowModal() == wx.ID_OK:
             project_path = dialog.GetPath()
-            # Get the event loop from the current thread and schedule the coroutine
-            loop = asyncio.get_event_loop()
-            asyncio.ensure_future(self.presenter.load_project(project_path), loop=loop)
+            # Schedule the load on the loop the application drives
+            task = wx.GetApp().loop.create_task(self.presenter.load_project(project_path))
+            self._pending_tasks.add(task)
+            task.add_done_callback(self._pending_tasks.discard)
 
         dialog.Destroy()
 
@@ -133,6 +172,21 @@ class MainView(wx.Frame):
 
     # View Interface Methods (called by presenter)
 
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """
+        Group several view updates into a single repaint.
+
+        The frame and its children are frozen for the duration of the block
+        and repainted once when it exits. Blocks may be nested; wx keeps a
+        freeze count and only the outermost exit repaints.
+        """
+        self.Freeze()
+        try:
+            yield
+        finally:
+            self.Thaw()
+
     def set_project_name(self, name: str) -> None:
         """
         Update the window title with the project name.
@@ -157,10 +211,16 @@ class MainView(wx.Frame):
         """
         Display an error message to the user.
 
+        The dialog is opened via wx.CallAfter, so the caller (typically a
+        presenter coroutine) returns immediately instead of blocking inside
+        the modal loop while the asyncio loop is running; once shown, the
+        dialog's nested event loop keeps driving asyncio.
+
         Args:
             message: The error message to display
         """
-        wx.MessageBox(
+        wx.CallAfter(
+            wx.MessageBox,
             message,
             "Error",
             wx.OK | wx.ICON_ERROR,
@@ -177,14 +237,7 @@ class MainView(wx.Frame):
         # Store targets for selection tracking
         self._targets = targets
 
-        # Clear existing items
-        self.target_list.DeleteAllItems()
-
-        # Add new items
-        for target in targets:
-            index = self.target_list.InsertItem(self.target_list.GetItemCount(), target.name)
-            self.target_list.SetItem(index, 1, target.command)
-            self.target_list.SetItem(index, 2, target.source_file)
+        self.target_list.set_targets(targets)
 
     def get_selected_target(self) -> Optional[Target]:
         """
@@ -3,8 +3,8 @@ Unit tests for the ConfigurationService.
 """
 import pytest
 from unittest.mock import MagicMock
-from src.core.services import ConfigurationService, CONFIG_FILE_NAME
-from src.core.models import ProjectConfig
+from src.core.services import ConfigurationService, CONFIG_FILE_NAME, LEGACY_CONFIG_FILE_NAME
+from src.core.models import ProjectConfig, Target
 
 # Mark all tests in this module as asyncio
 pytestmark = pytest.mark.asyncio
@@ -13,27 +13,66 @@ class MockFileSystemAdapter:
     """A mock implementation of IFileSystemAdapter for testing."""
     def __init__(self):
         self.files = {}
+        self.mtimes = {}
+        self._clock = 0.0
+        self._globs = {}
 
-    async def file_exists(self, path: str) -> bool:
-        return path in self.files
+    def register_glob(self, pattern: str, paths: list[str]) -> None:
+        """Make find_files return paths for pattern, whatever the root."""
+        self._globs[pattern] = list(paths)
+
+    async def get_mtime(self, path: str) -> float:
+        if path not in self.files:
+            raise FileNotFoundError(path)
+        return self.mtimes.get(path, 0.0)
 
     async def read_file(self, path: str) -> str:
-        return self.files.get(path, "")
+        if path not in self.files:
+            raise FileNotFoundError(path)
+        return self.files[path]
+
+    async def read_files(self, paths: list[str]) -> list:
+        results = []
+        for path in paths:
+            try:
+                results.append((await self.read_file(path)).encode("utf-8"))
+            except OSError:
+                results.append(None)
+        return results
 
     async def write_file(self, path: str, content: str) -> None:
+        # Simulate a monotonically advancing filesystem clock
+        self._clock += 1.0
         self.files[path] = content
-
-    async def find_files(self, pattern: str, root_dir: str) -> list[str]:
-        return [] # Not needed for this test
+        self.mtimes[path] = self._clock
+
+    async def find_files(self, pattern: str, root_dir: str, exclude_dirs=None) -> list[str]:
+        # Like the real adapter, never report files below an excluded directory
+        excluded = set(exclude_dirs or ())
+        return [
+            path for path in self._globs.get(pattern, [])
+            if not excluded.intersection(path.split("/")[:-1])
+        ]
+
+    async def find_files_multi(self, patterns: list[str], root_dir: str, exclude_dirs=None) -> list[str]:
+        # Delegate to find_files so registered globs also drive this method
+        results = []
+        for pattern in patterns:
+            results.extend(await self.find_files(pattern, root_dir, exclude_dirs=exclude_dirs))
+        return list(dict.fromkeys(results))
 
 class MockSerializer:
     """A mock implementation of IConfigSerializer for testing."""
+    def __init__(self):
+        self.deserialize_calls = 0
+
     def serialize(self, config: ProjectConfig) -> str:
         # A simple mock serialization
         return f"project_name: {config.project_name}"
 
     def deserialize(self, data: str) -> dict:
         # A simple mock deserialization
+        self.deserialize_calls += 1
         name = data.split(": ")[1]
         return {"project_name": name, "targets": [], "groups": []}
 
@@ -82,6 +121,118 @@ async def test_save_config_writes_serialized_data_to_file(config_service, mock_f
 
     await config_service.save_config(project_root, config_to_save)
 
-    assert await mock_fs_adapter.file_exists(config_path)
+    assert config_path in mock_fs_adapter.files
     file_content = await mock_fs_adapter.read_file(config_path)
     assert file_content == "project_name: My New Project"
+
+
+async def test_load_config_returns_memoized_config_for_unchanged_file(config_service, mock_fs_adapter):
+    """
+    Verify that reloading an unchanged config file returns the memoized instance.
+    """
+    project_root = "/fake/project"
+    await mock_fs_adapter.write_file(f"{project_root}/{CONFIG_FILE_NAME}", "project_name: Memo")
+
+    first = await config_service.load_config(project_root)
+    second = await config_service.load_config(project_root)
+
+    assert second is first
+
+async def test_load_config_memo_is_updated_by_save_config(config_service, mock_serializer):
+    """
+    Verify that a saved config is returned by the next load without deserializing.
+    """
+    project_root = "/fake/project"
+    saved = ProjectConfig(project_name="Saved")
+    await config_service.save_config(project_root, saved)
+
+    loaded = await config_service.load_config(project_root)
+
+    assert loaded is saved
+    assert mock_serializer.deserialize_calls == 0
+
+async def test_load_config_skips_read_when_mtime_unchanged(config_service, mock_fs_adapter):
+    """
+    Verify that a memoized config is returned without re-reading an unmodified file.
+    """
+    project_root = "/fake/project"
+    config_path = f"{project_root}/{CONFIG_FILE_NAME}"
+    await mock_fs_adapter.write_file(config_path, "project_name: Stat Only")
+    await config_service.load_config(project_root)
+
+    read_paths = []
+    original_read_file = mock_fs_adapter.read_file
+    async def mock_read_file(path):
+        read_paths.append(path)
+        return await original_read_file(path)
+    mock_fs_adapter.read_file = mock_read_file
+
+    config = await config_service.load_config(project_root)
+
+    assert config.project_name == "Stat Only"
+    assert read_paths == []
+
+async def test_load_config_migrates_legacy_config(mock_fs_adapter, mock_serializer):
+    """
+    Verify that a legacy YAML config is loaded and re-saved in the current format.
+    """
+    project_root = "/fake/project"
+    await mock_fs_adapter.write_file(f"{project_root}/{LEGACY_CONFIG_FILE_NAME}", "project_name: Legacy")
+    service = ConfigurationService(mock_fs_adapter, mock_serializer, legacy_serializer=MockSerializer())
+
+    config = await service.load_config(project_root)
+
+    assert config.project_name == "Legacy"
+    assert mock_fs_adapter.files[f"{project_root}/{CONFIG_FILE_NAME}"] == "project_name: Legacy"
+
+async def test_load_config_ignores_legacy_config_without_legacy_serializer(config_service, mock_fs_adapter):
+    """
+    Verify that a legacy config is not migrated unless a legacy serializer is configured.
+    """
+    project_root = "/fake/project"
+    await mock_fs_adapter.write_file(f"{project_root}/{LEGACY_CONFIG_FILE_NAME}", "project_name: Legacy")
+
+    assert await config_service.load_config(project_root) is None
+
+async def test_load_config_restores_target_models(config_service, mock_fs_adapter, mock_serializer):
+    """
+    Verify that targets in the deserialized data are rebuilt as Target objects.
+    """
+    project_root = "/fake/project"
+    await mock_fs_adapter.write_file(f"{project_root}/{CONFIG_FILE_NAME}", "project_name: Targets")
+    target_data = {"id": "abc-123", "name": "build", "command": "make build", "source_file": "Makefile"}
+    mock_serializer.deserialize = lambda data: {"project_name": "Targets", "targets": [target_data], "groups": []}
+
+    config = await config_service.load_config(project_root)
+
+    assert config.targets == [Target(**target_data)]
+
+async def test_load_config_returns_none_if_file_removed_after_stat(config_service, mock_fs_adapter):
+    """
+    Verify that a config deleted between the stat and the read is treated as missing.
+    """
+    project_root = "/fake/project"
+    config_path = f"{project_root}/{CONFIG_FILE_NAME}"
+    await mock_fs_adapter.write_file(config_path, "project_name: Gone")
+
+    async def mock_read_file(path):
+        raise FileNotFoundError(path)
+    mock_fs_adapter.read_file = mock_read_file
+
+    assert await config_service.load_config(project_root) is None
+
+async def test_invalidate_forces_reload_with_unchanged_mtime(config_service, mock_fs_adapter):
+    """
+    Verify that invalidate drops the memo even when the file's mtime did not change.
+    """
+    project_root = "/fake/project"
+    config_path = f"{project_root}/{CONFIG_FILE_NAME}"
+    await mock_fs_adapter.write_file(config_path, "project_name: Before")
+    await config_service.load_config(project_root)
+
+    # Simulate an edit within the filesystem's timestamp granularity
+    mock_fs_adapter.files[config_path] = "project_name: After"
+    config_service.invalidate(project_root)
+    config = await config_service.load_config(project_root)
+
+    assert config.project_name == "After"
@@ -3,7 +3,7 @@ Unit tests for the DiscoveryService.
 """
 import pytest
 import json
-from src.core.services import DiscoveryService
+from src.core.services import DiscoveryService, PACKAGE_JSON_STREAM_THRESHOLD
 from tests.core.test_configuration_service import MockFileSystemAdapter # Re-use our mock
 
 # Mark all tests in this module as asyncio
@@ -18,103 +18,152 @@ def discovery_service(mock_fs_adapter) -> DiscoveryService:
     return DiscoveryService(mock_fs_adapter)
 
 
-async def test_discover_from_package_json_finds_targets(discovery_service, mock_fs_adapter):
+PACKAGE_JSON_CASES = [
+    pytest.param(
+        '{"name": "test-project", "scripts": {"start": "node index.js", "test": "jest"}}',
+        [("start", "npm run start"), ("test", "npm run test")],
+        id="valid",
+    ),
+    pytest.param(None, [], id="missing"),
+    pytest.param("this is not valid json", [], id="malformed"),
+    pytest.param('{"name": "test-project-no-scripts"}', [], id="no_scripts"),
+]
+
+@pytest.mark.parametrize("content,expected", PACKAGE_JSON_CASES)
+async def test_discover_from_package_json(discovery_service, mock_fs_adapter, content, expected):
     """
-    Verify that the service correctly finds and parses a valid package.json.
+    Verify that package.json scripts are turned into targets, and that a missing,
+    malformed or script-less package.json yields none.
     """
     project_root = "/fake/project"
     package_json_path = f"{project_root}/package.json"
-    
-    mock_package_json = {
-        "name": "test-project",
-        "scripts": {
-            "start": "node index.js",
-            "test": "jest"
-        }
-    }
-    
-    mock_fs_adapter.files[package_json_path] = json.dumps(mock_package_json)
-    
-    # Mock the find_files method to return our test file
-    async def mock_find_files(pattern, root):
-        if pattern == "**/package.json":
-            return [package_json_path]
-        return []
-    mock_fs_adapter.find_files = mock_find_files
+    found = []
+    if content is not None:
+        mock_fs_adapter.files[package_json_path] = content
+        found.append(package_json_path)
+
+    mock_fs_adapter.register_glob("**/package.json", found)
 
     targets = await discovery_service.discover_targets(project_root)
 
-    assert len(targets) == 2
-    assert targets[0].name == "start"
-    assert targets[0].command == "npm run start"
-    assert targets[0].source_file == package_json_path
-    assert targets[1].name == "test"
+    assert [(t.name, t.command) for t in targets] == expected
+    assert all(t.source_file == package_json_path for t in targets)
 
-async def test_discover_handles_no_package_json(discovery_service, mock_fs_adapter):
+async def test_discover_streams_scripts_from_large_package_json(discovery_service, mock_fs_adapter):
     """
-    Verify that the service returns an empty list when no package.json is found.
+    Verify that a large package.json is only parsed up to the end of its scripts.
     """
     project_root = "/fake/project"
-    
-    # Mock find_files to return nothing
-    async def mock_find_files(pattern, root):
-        return []
-    mock_fs_adapter.find_files = mock_find_files
+    package_json_path = f"{project_root}/package.json"
+    dependencies = {f"pkg-{i}": "^1.0.0" for i in range(PACKAGE_JSON_STREAM_THRESHOLD // 10)}
+    content = json.dumps({"name": "big", "scripts": {"build": "tsc"}, "dependencies": dependencies})
+
+    # Truncate the dependency block; streaming must stop before reaching it
+    mock_fs_adapter.files[package_json_path] = content[:-100]
+
+    mock_fs_adapter.register_glob("**/package.json", [package_json_path])
 
     targets = await discovery_service.discover_targets(project_root)
-    assert len(targets) == 0
 
-async def test_discover_handles_malformed_package_json(discovery_service, mock_fs_adapter):
+    assert [t.name for t in targets] == ["build"]
+
+async def test_discover_parses_large_package_json_with_trailing_scripts(discovery_service, mock_fs_adapter):
     """
-    Verify that the service gracefully handles a malformed package.json file.
+    Verify that scripts declared after a large dependency block are still found.
     """
     project_root = "/fake/project"
     package_json_path = f"{project_root}/package.json"
+    dependencies = {f"pkg-{i}": "^1.0.0" for i in range(PACKAGE_JSON_STREAM_THRESHOLD // 10)}
+    mock_fs_adapter.files[package_json_path] = json.dumps(
+        {"name": "big", "dependencies": dependencies, "scripts": {"build": "tsc", "test": "jest"}}
+    )
 
-    mock_fs_adapter.files[package_json_path] = "this is not valid json"
-
-    async def mock_find_files(pattern, root):
-        if pattern == "**/package.json":
-            return [package_json_path]
-        return []
-    mock_fs_adapter.find_files = mock_find_files
+    mock_fs_adapter.register_glob("**/package.json", [package_json_path])
 
     targets = await discovery_service.discover_targets(project_root)
-    assert len(targets) == 0
 
-async def test_discover_handles_package_json_with_no_scripts(discovery_service, mock_fs_adapter):
+    assert [t.name for t in targets] == ["build", "test"]
+
+@pytest.mark.parametrize("content", [
+    pytest.param("this is not valid json", id="invalid_json"),
+    pytest.param("[1]", id="not_an_object"),
+    pytest.param('{"scripts": null}', id="scripts_not_an_object"),
+    pytest.param("[" + " " * PACKAGE_JSON_STREAM_THRESHOLD + "1]", id="large_not_an_object"),
+    pytest.param(
+        json.dumps({"dependencies": {f"pkg-{i}": "^1.0.0" for i in range(PACKAGE_JSON_STREAM_THRESHOLD // 10)}})[:-100],
+        id="large_truncated_without_scripts",
+    ),
+])
+async def test_discover_skips_known_malformed_package_json_until_modified(discovery_service, mock_fs_adapter, content):
     """
-    Verify that the service handles a package.json file that has no 'scripts' key.
+    Verify that a malformed package.json, including valid JSON of the wrong
+    shape, is not re-read until its mtime changes.
     """
     project_root = "/fake/project"
     package_json_path = f"{project_root}/package.json"
+    await mock_fs_adapter.write_file(package_json_path, content)
 
-    mock_package_json = {
-        "name": "test-project-no-scripts"
-    }
+    read_paths = []
+    original_read_files = mock_fs_adapter.read_files
+    async def mock_read_files(paths):
+        read_paths.extend(paths)
+        return await original_read_files(paths)
+    mock_fs_adapter.read_files = mock_read_files
 
-    mock_fs_adapter.files[package_json_path] = json.dumps(mock_package_json)
+    mock_fs_adapter.register_glob("**/package.json", [package_json_path])
 
-    async def mock_find_files(pattern, root):
-        if pattern == "**/package.json":
-            return [package_json_path]
-        return []
-    mock_fs_adapter.find_files = mock_find_files
+    assert await discovery_service.discover_targets(project_root) == []
+    assert await discovery_service.discover_targets(project_root) == []
+    assert read_paths == [package_json_path]
 
+    await mock_fs_adapter.write_file(package_json_path, '{"scripts": {"start": "node ."}}')
     targets = await discovery_service.discover_targets(project_root)
-    assert len(targets) == 0
 
+    assert [t.name for t in targets] == ["start"]
 
-# Makefile Discovery Tests
+async def test_discover_skips_unreadable_package_json(discovery_service, mock_fs_adapter):
+    """
+    Verify that a package.json that fails to read does not prevent others from being parsed.
+    """
+    project_root = "/fake/project"
+    good_path = f"{project_root}/package.json"
+    bad_path = f"{project_root}/broken/package.json"
+    mock_fs_adapter.files[good_path] = '{"scripts": {"start": "node index.js"}}'
+
+    original_read_files = mock_fs_adapter.read_files
+    async def mock_read_files(paths):
+        # As if bad_path exists but cannot be opened
+        contents = await original_read_files(paths)
+        return [None if path == bad_path else content for path, content in zip(paths, contents)]
+    mock_fs_adapter.read_files = mock_read_files
+
+    mock_fs_adapter.register_glob("**/package.json", [bad_path, good_path])
+
+    targets = await discovery_service.discover_targets(project_root)
 
-async def test_discover_from_makefile_finds_targets(discovery_service, mock_fs_adapter):
+    assert [t.name for t in targets] == ["start"]
+    assert targets[0].source_file == good_path
+
+async def test_discover_deduplicates_scripts_across_package_json_files(discovery_service, mock_fs_adapter):
     """
-    Test: DiscoveryService finds and parses Makefile targets.
+    Verify that a script name repeated across workspaces yields a single target.
     """
     project_root = "/fake/project"
-    makefile_path = f"{project_root}/Makefile"
+    root_path = f"{project_root}/package.json"
+    workspace_path = f"{project_root}/packages/app/package.json"
+    mock_fs_adapter.files[root_path] = '{"scripts": {"build": "tsc -b"}}'
+    mock_fs_adapter.files[workspace_path] = '{"scripts": {"build": "tsc", "dev": "vite"}}'
+
+    mock_fs_adapter.register_glob("**/package.json", [root_path, workspace_path])
+
+    targets = await discovery_service.discover_targets(project_root)
 
-    makefile_content = """
+    assert [t.name for t in targets] == ["build", "dev"]
+    assert targets[0].source_file == root_path
+
+# Makefile Discovery Tests
+
+MAKEFILE_FULL = """
 .PHONY: build test clean install
 
 build:
@@ -130,77 +179,95 @@ install: build
 \tcp app /usr/local/bin/
 """
 
-    mock_fs_adapter.files[makefile_path] = makefile_content
+MAKEFILE_PHONY_ONLY = """.PHONY: all
+all:
+\techo "Building"
+"""
 
-    async def mock_find_files(pattern, root):
-        if pattern == "**/package.json":
-            return []
-        if pattern == "**/Makefile" or pattern == "**/makefile":
-            return [makefile_path]
-        return []
-    mock_fs_adapter.find_files = mock_find_files
+MAKEFILE_CASES = [
+    pytest.param(MAKEFILE_FULL, ["build", "test", "clean", "install"], id="targets"),
+    pytest.param(MAKEFILE_PHONY_ONLY, ["all"], id="phony_line"),
+    pytest.param(".PHONY: app\napp:\n\tcc -o app main.c\n", ["app"], id="phony"),
+    pytest.param(".c.o:\n\t$(CC) -c $<\nall:\n\tcc main.c\n", ["all"], id="suffix_rule"),
+    pytest.param(".o.a:\n\tar r $@ $<\n", [], id="lowercase_suffix_rule"),
+    pytest.param("", [], id="empty"),
+]
+
+@pytest.mark.parametrize("content,expected", MAKEFILE_CASES)
+async def test_discover_from_makefile(discovery_service, mock_fs_adapter, content, expected):
+    """
+    Test: DiscoveryService turns Makefile targets into make commands, skipping
+    .PHONY declarations and suffix rules and coping with an empty Makefile.
+    """
+    project_root = "/fake/project"
+    makefile_path = f"{project_root}/Makefile"
+    mock_fs_adapter.files[makefile_path] = content
+
+    mock_fs_adapter.register_glob("**/Makefile", [makefile_path])
 
     targets = await discovery_service.discover_targets(project_root)
 
-    # Should find: build, test, clean, install
-    assert len(targets) >= 4
-    target_names = [t.name for t in targets]
-    assert "build" in target_names
-    assert "test" in target_names
-    assert "clean" in target_names
-    assert "install" in target_names
+    assert [t.name for t in targets] == expected
+    assert [t.command for t in targets] == [f"make {name}" for name in expected]
+    assert all(t.source_file == makefile_path for t in targets)
 
-    # Verify command format
-    build_target = next(t for t in targets if t.name == "build")
-    assert build_target.command == "make build"
-    assert build_target.source_file == makefile_path
 
-
-async def test_discover_from_makefile_ignores_phony_line(discovery_service, mock_fs_adapter):
+async def test_discover_from_makefile_handles_dotted_targets_and_assignments(discovery_service, mock_fs_adapter):
     """
-    Test: DiscoveryService doesn't create targets for .PHONY declarations.
+    Test: Dotted target names are found, while variable assignments and special targets are not.
     """
     project_root = "/fake/project"
     makefile_path = f"{project_root}/Makefile"
+    mock_fs_adapter.files[makefile_path] = (
+        "CC := gcc\n"
+        "PREFIX ::= /usr/local\n"
+        ".PHONY: docs.html\n"
+        "docs.html: README.md\n"
+        "\tpandoc README.md -o docs.html\n"
+        "install:: build\n"
+    )
 
-    makefile_content = """.PHONY: all
-all:
-\techo "Building"
-"""
+    mock_fs_adapter.register_glob("**/Makefile", [makefile_path])
 
-    mock_fs_adapter.files[makefile_path] = makefile_content
+    targets = await discovery_service.discover_targets(project_root)
 
-    async def mock_find_files(pattern, root):
-        if "Makefile" in pattern or "makefile" in pattern:
-            return [makefile_path]
-        return []
-    mock_fs_adapter.find_files = mock_find_files
+    assert [t.name for t in targets] == ["docs.html", "install"]
 
-    targets = await discovery_service.discover_targets(project_root)
 
-    target_names = [t.name for t in targets]
-    assert ".PHONY" not in target_names
-    assert "all" in target_names
+async def test_discover_from_large_makefile(discovery_service, mock_fs_adapter):
+    """
+    Test: Every target in a 10,000-line Makefile is found, and nothing else.
+    """
+    project_root = "/fake/project"
+    makefile_path = f"{project_root}/Makefile"
+    lines = []
+    for i in range(2500):
+        lines += [f"OBJ_{i} := obj/{i}.o", f".PHONY: target-{i}", f"target-{i}: $(OBJ_{i})", "\t@echo done"]
+    mock_fs_adapter.files[makefile_path] = "\n".join(lines) + "\n"
 
+    mock_fs_adapter.register_glob("**/Makefile", [makefile_path])
 
-async def test_discover_handles_empty_makefile(discovery_service, mock_fs_adapter):
+    targets = await discovery_service.discover_targets(project_root)
+
+    assert [t.name for t in targets] == [f"target-{i}" for i in range(2500)]
+
+async def test_discover_from_makefile_with_non_utf8_content(discovery_service, mock_fs_adapter):
     """
-    Test: DiscoveryService handles empty Makefile gracefully.
+    Test: Targets are still found in a Makefile that is not valid UTF-8.
     """
     project_root = "/fake/project"
     makefile_path = f"{project_root}/Makefile"
 
-    mock_fs_adapter.files[makefile_path] = ""
+    mock_fs_adapter.register_glob("**/Makefile", [makefile_path])
 
-    async def mock_find_files(pattern, root):
-        if "Makefile" in pattern or "makefile" in pattern:
-            return [makefile_path]
-        return []
-    mock_fs_adapter.find_files = mock_find_files
+    async def mock_read_files(paths):
+        # Latin-1 encoded comment, which is not valid UTF-8
+        return [b"# Auteur: Ren\xe9\nbuild:\n\tgcc main.c\n" for _ in paths]
+    mock_fs_adapter.read_files = mock_read_files
 
     targets = await discovery_service.discover_targets(project_root)
-    # Should still work, just return empty or only package.json targets
-    assert isinstance(targets, list)
+
+    assert [t.name for t in targets] == ["build"]
 
 
 # Script File Discovery Tests
@@ -216,11 +283,7 @@ async def test_discover_from_shell_scripts_finds_targets(discovery_service, mock
     mock_fs_adapter.files[script1_path] = "#!/bin/bash\necho 'Building...'"
     mock_fs_adapter.files[script2_path] = "#!/bin/bash\necho 'Deploying...'"
 
-    async def mock_find_files(pattern, root):
-        if pattern == "**/*.sh":
-            return [script1_path, script2_path]
-        return []
-    mock_fs_adapter.find_files = mock_find_files
+    mock_fs_adapter.register_glob("**/*.sh", [script1_path, script2_path])
 
     targets = await discovery_service.discover_targets(project_root)
 
@@ -246,11 +309,7 @@ async def test_discover_from_python_scripts_finds_targets(discovery_service, moc
 
     mock_fs_adapter.files[script_path] = "#!/usr/bin/env python3\nprint('Running tests')"
 
-    async def mock_find_files(pattern, root):
-        if pattern == "**/*.py":
-            return [script_path]
-        return []
-    mock_fs_adapter.find_files = mock_find_files
+    mock_fs_adapter.register_glob("**/*.py", [script_path])
 
     targets = await discovery_service.discover_targets(project_root)
 
@@ -263,6 +322,70 @@ async def test_discover_from_python_scripts_finds_targets(discovery_service, moc
     assert test_target.source_file == script_path
 
 
+async def test_discover_from_python_scripts_skips_non_scripts(discovery_service, mock_fs_adapter):
+    """
+    Test: Python files in package directories and non-script Python files are skipped.
+    """
+    project_root = "/fake/src/project"
+    script_path = f"{project_root}/manage.py"
+    shell_path = f"{project_root}/tests/run.sh"
+
+    mock_fs_adapter.register_glob("**/*.py", [
+        script_path,
+        f"{project_root}/setup.py",
+        f"{project_root}/pkg/__init__.py",
+        f"{project_root}/src/app/main.py",
+        f"{project_root}/tests/test_app.py",
+    ])
+    mock_fs_adapter.register_glob("**/*.sh", [shell_path])
+
+    targets = await discovery_service.discover_targets(project_root)
+
+    assert [t.name for t in targets] == ["run.sh", "manage.py"]
+
+
+async def test_discover_targets_uses_single_walk(discovery_service, mock_fs_adapter):
+    """
+    Test: All sources are found with one multi-pattern search that is split by file name.
+    """
+    project_root = "/fake/project"
+    calls = []
+    package_json_path = f"{project_root}/package.json"
+    makefile_path = f"{project_root}/Makefile"
+    script_path = f"{project_root}/deploy.sh"
+    mock_fs_adapter.files[package_json_path] = '{"scripts": {"start": "node ."}}'
+    mock_fs_adapter.files[makefile_path] = "build:\n\tmake all\n"
+    mock_fs_adapter.files[script_path] = "#!/bin/sh\n"
+
+    async def mock_find_files_multi(patterns, root, exclude_dirs=None):
+        calls.append(patterns)
+        return [package_json_path, makefile_path, script_path]
+    mock_fs_adapter.find_files_multi = mock_find_files_multi
+    mock_fs_adapter.find_files = None  # Any single-pattern search would fail
+
+    targets = await discovery_service.discover_targets(project_root)
+
+    assert len(calls) == 1
+    assert {"**/package.json", "**/Makefile", "**/makefile", "**/*.sh", "**/*.py"} <= set(calls[0])
+    assert [t.name for t in targets] == ["start", "build", "deploy.sh"]
+
+
+async def test_discover_searches_build_dirs_but_not_vendored_dirs(discovery_service, mock_fs_adapter):
+    """
+    Test: Makefiles under build/ are discovered, while node_modules is still skipped.
+    """
+    project_root = "/fake/project"
+    build_makefile = f"{project_root}/build/Makefile"
+    vendored_makefile = f"{project_root}/node_modules/dep/Makefile"
+    mock_fs_adapter.files[build_makefile] = "package:\n\ttar czf out.tgz .\n"
+    mock_fs_adapter.files[vendored_makefile] = "vendored:\n\ttrue\n"
+    mock_fs_adapter.register_glob("**/Makefile", [build_makefile, vendored_makefile])
+
+    targets = await discovery_service.discover_targets(project_root)
+
+    assert [(t.name, t.source_file) for t in targets] == [("package", build_makefile)]
+
+
 async def test_discover_from_scripts_handles_multiple_types(discovery_service, mock_fs_adapter):
     """
     Test: DiscoveryService discovers both shell and Python scripts.
@@ -274,13 +397,8 @@ async def test_discover_from_scripts_handles_multiple_types(discovery_service, m
     mock_fs_adapter.files[sh_script] = "#!/bin/bash\necho 'Build'"
     mock_fs_adapter.files[py_script] = "#!/usr/bin/env python3\nprint('Test')"
 
-    async def mock_find_files(pattern, root):
-        if pattern == "**/*.sh":
-            return [sh_script]
-        elif pattern == "**/*.py":
-            return [py_script]
-        return []
-    mock_fs_adapter.find_files = mock_find_files
+    mock_fs_adapter.register_glob("**/*.sh", [sh_script])
+    mock_fs_adapter.register_glob("**/*.py", [py_script])
 
     targets = await discovery_service.discover_targets(project_root)
 
@@ -295,10 +413,6 @@ async def test_discover_handles_no_scripts(discovery_service, mock_fs_adapter):
     """
     project_root = "/fake/project"
 
-    async def mock_find_files(pattern, root):
-        return []
-    mock_fs_adapter.find_files = mock_find_files
-
     targets = await discovery_service.discover_targets(project_root)
     # Should return empty list when no scripts found
-    assert isinstance(targets, list)
\ No newline at end of file
+    assert isinstance(targets, list)
@@ -2,12 +2,17 @@
 Unit tests for the ExecutionService.
 """
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, AsyncMock
 from src.core.services import ExecutionService
 from src.core.models import Target
 
+# Mark all tests in this module as asyncio
+pytestmark = pytest.mark.asyncio
+
 class MockRunningProcess:
     """A mock implementation of IRunningProcess for testing."""
+    __slots__ = ("pid", "_on_close_callback", "kill_called")
+
     def __init__(self, pid: int):
         self.pid = pid
         self._on_close_callback = None
@@ -24,28 +29,29 @@ class MockRunningProcess:
 @pytest.fixture
 def mock_shell_adapter():
     adapter = Mock()
+    adapter.get_system_shell.return_value = "/bin/sh"
     # Configure the 'execute' method to return a mock process
-    adapter.execute.side_effect = lambda command, working_dir, shell: MockRunningProcess(pid=123)
+    adapter.execute = AsyncMock(return_value=MockRunningProcess(pid=123))
     return adapter
 
 @pytest.fixture
 def execution_service(mock_shell_adapter):
     return ExecutionService(mock_shell_adapter)
 
-def test_run_target_executes_command_and_tracks_process(execution_service, mock_shell_adapter):
+async def test_run_target_executes_command_and_tracks_process(execution_service, mock_shell_adapter):
     """Verify that run_target executes a command and tracks its process."""
     target = Target(name="test", command="echo 'hello'", source_file="test.sh")
     
-    pid = execution_service.run_target(target, "/fake/project", "/bin/bash")
+    pid = await execution_service.run_target(target, "/fake/project", "/bin/bash")
 
     assert pid == 123
     mock_shell_adapter.execute.assert_called_once_with("echo 'hello'", "/fake/project", "/bin/bash")
     assert execution_service.get_running_processes() == [123]
 
-def test_cancel_target_kills_process_and_removes_from_tracking(execution_service):
+async def test_cancel_target_kills_process_and_removes_from_tracking(execution_service):
     """Verify that cancel_target calls kill() and the process is removed."""
     target = Target(name="test", command="sleep 10", source_file="test.sh")
-    pid = execution_service.run_target(target, "/fake/project", "/bin/bash")
+    pid = await execution_service.run_target(target, "/fake/project", "/bin/bash")
 
     assert execution_service.get_running_processes() == [123]
     
@@ -58,7 +64,7 @@ def test_cancel_target_kills_process_and_removes_from_tracking(execution_service
     assert process.kill_called is True
     assert execution_service.get_running_processes() == []
 
-def test_get_running_processes_returns_correct_pids(execution_service, mock_shell_adapter):
+async def test_get_running_processes_returns_correct_pids(execution_service, mock_shell_adapter):
     """Verify that get_running_processes returns a list of active PIDs."""
     # Configure the mock to return different PIDs on subsequent calls
     mock_shell_adapter.execute.side_effect = [MockRunningProcess(pid=101), MockRunningProcess(pid=202)]
@@ -66,10 +72,38 @@ def test_get_running_processes_returns_correct_pids(execution_service, mock_shel
     target1 = Target(name="test1", command="cmd1", source_file="test.sh")
     target2 = Target(name="test2", command="cmd2", source_file="test.sh")
 
-    pid1 = execution_service.run_target(target1, "/fake", "/bin/sh")
-    pid2 = execution_service.run_target(target2, "/fake", "/bin/sh")
+    pid1 = await execution_service.run_target(target1, "/fake", "/bin/sh")
+    pid2 = await execution_service.run_target(target2, "/fake", "/bin/sh")
 
     running_pids = execution_service.get_running_processes()
     assert len(running_pids) == 2
     assert 101 in running_pids
-    assert 202 in running_pids
\ No newline at end of file
+    assert 202 in running_pids
+
+async def test_run_target_defaults_to_system_shell(execution_service, mock_shell_adapter):
+    """Verify that run_target asks the adapter for the system shell on every run without one."""
+    target = Target(name="test", command="echo 'hello'", source_file="test.sh")
+    # A changed answer, e.g. after the adapter's shell cache is invalidated
+    mock_shell_adapter.get_system_shell.side_effect = ["/bin/sh", "/bin/zsh"]
+
+    await execution_service.run_target(target, "/fake/project")
+    await execution_service.run_target(target, "/fake/project")
+
+    assert [c.args[2] for c in mock_shell_adapter.execute.call_args_list] == ["/bin/sh", "/bin/zsh"]
+
+async def test_running_processes_stay_consistent_across_many_closes(execution_service, mock_shell_adapter):
+    """Verify that tracking stays correct when thousands of processes close out of order."""
+    processes = [MockRunningProcess(pid=pid) for pid in range(1, 10001)]
+    mock_shell_adapter.execute.side_effect = processes
+    target = Target(name="test", command="cmd", source_file="test.sh")
+    for _ in processes:
+        await execution_service.run_target(target, "/fake", "/bin/sh")
+
+    # Close every other process, then the rest in reverse
+    for process in processes[::2]:
+        execution_service.cancel_target(process.pid)
+    assert sorted(execution_service.get_running_processes()) == [p.pid for p in processes[1::2]]
+
+    for process in reversed(processes[1::2]):
+        execution_service.cancel_target(process.pid)
+    assert execution_service.get_running_processes() == []
@@ -19,11 +19,7 @@ def mock_discovery_service():
 
 @pytest.fixture
 def mock_execution_service():
-    service = Mock(spec=ExecutionService)
-    # Mock the nested adapter for get_system_shell
-    service._shell_adapter = Mock()
-    service._shell_adapter.get_system_shell.return_value = "/bin/zsh"
-    return service
+    return Mock(spec=ExecutionService)
 
 @pytest.fixture
 def project_service(mock_config_service, mock_discovery_service, mock_execution_service):
@@ -80,21 +76,50 @@ async def test_run_target_executes_correct_target(project_service, mock_executio
     """
     target_to_run = Target(id="abc-123", name="test", command="npm test", source_file="package.json")
     # Manually set up the service's internal state for the test
-    project_service._config = ProjectConfig(project_name="Test", targets=[target_to_run])
+    project_service._set_config(ProjectConfig(project_name="Test", targets=[target_to_run]))
     project_service._project_root = "/fake/project"
     mock_execution_service.run_target.return_value = 999
 
-    pid = project_service.run_target("abc-123")
+    pid = await project_service.run_target("abc-123")
 
     assert pid == 999
+    # No shell configured, so the execution service falls back to its default
+    mock_execution_service.run_target.assert_called_once_with(target_to_run, "/fake/project", None)
+
+async def test_run_target_uses_configured_shell(project_service, mock_execution_service):
+    """
+    Verify that a shell set in the project config is passed to the execution service.
+    """
+    target_to_run = Target(id="abc-123", name="test", command="npm test", source_file="package.json")
+    project_service._set_config(ProjectConfig(project_name="Test", targets=[target_to_run], shell="/bin/zsh"))
+    project_service._project_root = "/fake/project"
+
+    await project_service.run_target("abc-123")
+
     mock_execution_service.run_target.assert_called_once_with(target_to_run, "/fake/project", "/bin/zsh")
 
 async def test_run_target_raises_error_if_not_found(project_service):
     """
     Verify that run_target raises a ValueError for an unknown target ID.
     """
-    project_service._config = ProjectConfig(project_name="Test", targets=[])
+    project_service._set_config(ProjectConfig(project_name="Test", targets=[]))
     project_service._project_root = "/fake/project"
 
     with pytest.raises(ValueError, match="Target with ID 'xyz-789' not found."):
-        project_service.run_target("xyz-789")
\ No newline at end of file
+        await project_service.run_target("xyz-789")
+
+
+async def test_run_target_finds_target_from_loaded_project(project_service, mock_config_service, mock_execution_service):
+    """
+    Verify that targets of a loaded project are indexed for run_target.
+    """
+    target_to_run = Target(id="abc-123", name="test", command="npm test", source_file="package.json")
+    other_target = Target(id="def-456", name="lint", command="npm run lint", source_file="package.json")
+    mock_config_service.load_config = AsyncMock(
+        return_value=ProjectConfig(project_name="Test", targets=[other_target, target_to_run])
+    )
+    await project_service.load_project("/fake/project")
+
+    await project_service.run_target("abc-123")
+
+    mock_execution_service.run_target.assert_called_once_with(target_to_run, "/fake/project", None)
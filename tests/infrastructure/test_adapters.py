@@ -2,8 +2,13 @@
 Integration tests for the infrastructure adapters.
 These tests perform real I/O operations.
 """
+import asyncio
 import pytest
-from src.infrastructure.adapters import YamlConfigSerializer, AioFileSystemAdapter
+import yaml
+from src.infrastructure import adapters
+from src.infrastructure.adapters import (
+    YamlConfigSerializer, OrjsonConfigSerializer, AioFileSystemAdapter, AsyncioShellAdapter
+)
 from src.core.models import ProjectConfig, Target
 
 @pytest.fixture
@@ -25,6 +30,35 @@ def test_yaml_serializer_cycle(serializer):
     assert deserialized_data['project_name'] == "Test Project"
     assert deserialized_data['targets'][0]['name'] == "build"
 
+def test_yaml_serializer_rejects_python_tags(serializer):
+    """Test that deserialization stays safe with the LibYAML-backed loader."""
+    with pytest.raises(yaml.YAMLError):
+        serializer.deserialize("!!python/object/apply:os.system ['true']")
+
+def test_orjson_serializer_cycle():
+    """Test that the orjson serializer round-trips a config through JSON text."""
+    serializer = OrjsonConfigSerializer()
+    target = Target(name="build", command="make build", source_file="Makefile")
+    config = ProjectConfig(project_name="Test Project", targets=[target])
+
+    serialized_data = serializer.serialize(config)
+    deserialized_data = serializer.deserialize(serialized_data)
+
+    assert isinstance(serialized_data, str)
+    assert deserialized_data['project_name'] == "Test Project"
+    assert deserialized_data['targets'][0]['name'] == "build"
+
+def test_orjson_serializer_falls_back_to_stdlib_json(monkeypatch):
+    """Test that the serializer writes identical JSON when orjson is not installed."""
+    serializer = OrjsonConfigSerializer()
+    config = ProjectConfig(project_name="Test Project", targets=[Target(name="build", command="make build", source_file="Makefile")])
+    expected = serializer.serialize(config)
+
+    monkeypatch.setattr(adapters, "orjson", None)
+
+    assert serializer.serialize(config) == expected
+    assert serializer.deserialize(expected)['project_name'] == "Test Project"
+
 async def test_fs_adapter_write_read_cycle(fs_adapter, tmp_path):
     """Test writing a file and then reading it back."""
     test_file = tmp_path / "test.txt"
@@ -35,15 +69,6 @@ async def test_fs_adapter_write_read_cycle(fs_adapter, tmp_path):
 
     assert read_content == content
 
-async def test_fs_adapter_file_exists(fs_adapter, tmp_path):
-    """Test the file_exists method."""
-    existing_file = tmp_path / "exists.txt"
-    non_existing_file = tmp_path / "does_not_exist.txt"
-    await fs_adapter.write_file(str(existing_file), "data")
-
-    assert await fs_adapter.file_exists(str(existing_file)) is True
-    assert await fs_adapter.file_exists(str(non_existing_file)) is False
-
 async def test_fs_adapter_find_files(fs_adapter, tmp_path):
     """Test the find_files method."""
     # Create a nested structure
@@ -55,4 +80,162 @@ async def test_fs_adapter_find_files(fs_adapter, tmp_path):
 
     assert len(found_files) == 2
     assert str(tmp_path / "package.json") in found_files
-    assert str(tmp_path / "sub" / "package.json") in found_files
\ No newline at end of file
+    assert str(tmp_path / "sub" / "package.json") in found_files
+
+async def test_fs_adapter_get_mtime(fs_adapter, tmp_path):
+    """Test the get_mtime method."""
+    existing_file = tmp_path / "exists.txt"
+    await fs_adapter.write_file(str(existing_file), "data")
+
+    assert await fs_adapter.get_mtime(str(existing_file)) == existing_file.stat().st_mtime
+    with pytest.raises(FileNotFoundError):
+        await fs_adapter.get_mtime(str(tmp_path / "does_not_exist.txt"))
+
+async def test_fs_adapter_read_files(fs_adapter, tmp_path):
+    """Test that read_files returns contents in order and None for unreadable files."""
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+    await fs_adapter.write_file(str(first), "one")
+    await fs_adapter.write_file(str(second), "two")
+
+    contents = await fs_adapter.read_files(
+        [str(second), str(tmp_path / "missing.txt"), str(first)]
+    )
+
+    assert contents == [b"two", None, b"one"]
+
+async def test_fs_adapter_find_files_prunes_excluded_dirs(fs_adapter, tmp_path):
+    """Test that find_files does not descend into excluded directories."""
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "package.json").touch()
+    (tmp_path / "node_modules" / "dep").mkdir(parents=True)
+    (tmp_path / "node_modules" / "dep" / "package.json").touch()
+    (tmp_path / "package.json").touch()
+
+    found_files = await fs_adapter.find_files(
+        "**/package.json", str(tmp_path), exclude_dirs=["node_modules"]
+    )
+
+    assert sorted(found_files) == sorted([
+        str(tmp_path / "package.json"),
+        str(tmp_path / "app" / "package.json"),
+    ])
+
+async def test_fs_adapter_find_files_skips_hidden_dirs_like_glob(fs_adapter, tmp_path):
+    """Test that recursive basename patterns skip hidden directories, as glob does."""
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "hook.sh").touch()
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "build.sh").touch()
+    (tmp_path / "scripts" / "notes.txt").touch()
+
+    found_files = await fs_adapter.find_files("**/*.sh", str(tmp_path))
+
+    assert found_files == [str(tmp_path / "scripts" / "build.sh")]
+
+async def test_fs_adapter_find_files_multi(fs_adapter, tmp_path):
+    """Test that find_files_multi matches several patterns without duplicates."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "Makefile").touch()
+    (tmp_path / "sub" / "makefile").touch()
+    (tmp_path / "sub" / "other.mk").touch()
+
+    found_files = await fs_adapter.find_files_multi(
+        ["**/Makefile", "**/makefile", "**/Makefile"], str(tmp_path)
+    )
+
+    assert sorted(found_files) == sorted([
+        str(tmp_path / "Makefile"),
+        str(tmp_path / "sub" / "makefile"),
+    ])
+
+async def test_fs_adapter_find_files_multi_dedupes_symlinked_paths(fs_adapter, tmp_path):
+    """Test that a file reached through a symlinked directory is returned once."""
+    (tmp_path / "real").mkdir()
+    (tmp_path / "real" / "Makefile").touch()
+    (tmp_path / "link").symlink_to(tmp_path / "real", target_is_directory=True)
+
+    found_files = await fs_adapter.find_files_multi(
+        ["real/Makefile", "link/Makefile"], str(tmp_path)
+    )
+
+    assert found_files == [str(tmp_path / "real" / "Makefile")]
+
+async def test_fs_adapter_find_files_shallow_pattern(fs_adapter, tmp_path):
+    """Test that a pattern without a directory part only matches files in root_dir."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "build.sh").touch()
+    (tmp_path / ".hidden.sh").touch()
+    (tmp_path / "sub" / "deploy.sh").touch()
+
+    found_files = await fs_adapter.find_files("*.sh", str(tmp_path))
+
+    assert found_files == [str(tmp_path / "build.sh")]
+
+async def test_fs_adapter_find_files_multi_shallow_and_recursive(fs_adapter, tmp_path):
+    """Test that files matched by both a shallow and a recursive pattern are returned once."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "build.sh").touch()
+    (tmp_path / "sub" / "deploy.sh").touch()
+
+    found_files = await fs_adapter.find_files_multi(["*.sh", "**/*.sh"], str(tmp_path))
+
+    assert sorted(found_files) == sorted([str(tmp_path / "build.sh"), str(tmp_path / "sub" / "deploy.sh")])
+
+async def test_fs_adapter_find_files_multi_wildcards_in_large_tree(fs_adapter, tmp_path):
+    """Test that several wildcard patterns are matched across a 1000-file tree."""
+    expected = []
+    for d in range(20):
+        sub = tmp_path / f"pkg{d}"
+        sub.mkdir()
+        for f in range(25):
+            (sub / f"mod{f}.txt").touch()
+            (sub / f"tool{f}.sh").touch()
+            expected.append(str(sub / f"tool{f}.sh"))
+        (sub / ".env.sh").touch()
+        (sub / ".prettierrc").touch()
+        expected.append(str(sub / ".prettierrc"))
+
+    found_files = await fs_adapter.find_files_multi(["**/*.sh", "**/.prettier*"], str(tmp_path))
+
+    assert sorted(found_files) == sorted(expected)
+
+def test_shell_adapter_caches_system_shell(monkeypatch, tmp_path):
+    """Test that the system shell is resolved once until the cache is invalidated."""
+    first_shell = tmp_path / "first-sh"
+    second_shell = tmp_path / "second-sh"
+    first_shell.touch()
+    second_shell.touch()
+    adapter = AsyncioShellAdapter()
+
+    monkeypatch.setenv("SHELL", str(first_shell))
+    assert adapter.get_system_shell() == str(first_shell)
+
+    monkeypatch.setenv("SHELL", str(second_shell))
+    assert adapter.get_system_shell() == str(first_shell)
+
+    adapter.invalidate_shell_cache()
+    assert adapter.get_system_shell() == str(second_shell)
+
+async def test_shell_adapter_stream_reader_decodes_split_characters(monkeypatch):
+    """Test that multi-byte characters split across read chunks are decoded intact."""
+    monkeypatch.setattr(adapters, "STREAM_CHUNK_SIZE", 1)
+    stream = asyncio.StreamReader()
+    stream.feed_data("héllo wörld\n".encode("utf-8"))
+    stream.feed_eof()
+    received = []
+
+    await AsyncioShellAdapter()._stream_reader(stream, received.append)
+
+    assert "".join(received) == "héllo wörld\n"
+
+async def test_shell_adapter_stream_reader_replaces_invalid_bytes():
+    """Test that invalid UTF-8 output is replaced rather than aborting the reader."""
+    stream = asyncio.StreamReader()
+    stream.feed_data(b"ok \xff done")
+    stream.feed_eof()
+    received = []
+
+    await AsyncioShellAdapter()._stream_reader(stream, received.append)
+
+    assert "".join(received) == "ok \ufffd done"
@@ -0,0 +1,56 @@
+"""
+Shared fixtures for the GUI tests.
+"""
+import os
+import sys
+import importlib.util
+
+import pytest
+from src.core.models import Target, ProjectConfig
+
+
+def _gui_available() -> bool:
+    """Whether wx is installed and there is a display to create windows on."""
+    if os.environ.get("SKIP_GUI_TESTS"):
+        return False
+    if importlib.util.find_spec("wx") is None:
+        return False
+    if sys.platform.startswith("linux"):
+        return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+    return True
+
+
+# The integration tests import wx and open real windows, so they are not even
+# collected without a GUI; the presenter unit tests run everywhere
+collect_ignore_glob = [] if _gui_available() else ["integration/*"]
+
+
+@pytest.fixture(scope="session")
+def wx_app():
+    """
+    Create one plain wx.App for the whole GUI test run.
+
+    It sets up no event loop, executor or timer; the DashboardApp tests build
+    their own app and hand wx back to this one when they finish.
+    """
+    import wx
+
+    app = wx.App(False)
+    yield app
+    app.Destroy()
+
+
+@pytest.fixture(scope="session")
+def sample_targets():
+    """Sample targets shared by the whole run; a tuple, so tests cannot mutate it."""
+    return (
+        Target(name="build", command="npm run build", source_file="package.json"),
+        Target(name="test", command="npm test", source_file="package.json"),
+        Target(name="lint", command="npm run lint", source_file="package.json"),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_config(sample_targets):
+    """A loaded project config over sample_targets."""
+    return ProjectConfig(project_name="Test Project", targets=list(sample_targets))
@@ -4,12 +4,38 @@ Integration tests for the application entry point.
 These tests verify that the application can be launched and properly
 initializes all components (services, presenter, view).
 """
+import asyncio
 import pytest
 import wx
 from unittest.mock import Mock, patch, MagicMock
 import os
 
 
+@pytest.fixture(scope="module")
+def dashboard_app(wx_app):
+    """
+    Create one DashboardApp for every test in this module that needs one.
+
+    DashboardApp installs an event loop policy, a loop, an I/O executor and a
+    timer, so the teardown undoes all of that and makes the session's plain
+    app current again.
+    """
+    from src.presentation.gui.app import DashboardApp
+
+    previous_policy = asyncio.get_event_loop_policy()
+    app = DashboardApp(redirect=False)
+    yield app
+
+    # MainLoop never runs here, so OnExit is not called by wx
+    app.OnExit()
+    app.loop.close()
+    app.main_view.Destroy()
+    app.Destroy()
+    asyncio.set_event_loop_policy(previous_policy)
+    asyncio.set_event_loop(None)
+    wx.App.SetInstance(wx_app)
+
+
 class TestApplicationSetup:
     """Test application initialization and setup."""
 
@@ -34,26 +60,21 @@ class TestApplicationSetup:
         from src.presentation.gui.app import DashboardApp
         assert issubclass(DashboardApp, wx.App)
 
-    def test_dashboard_app_can_be_instantiated(self):
+    def test_dashboard_app_can_be_instantiated(self, dashboard_app):
         """
         Test 4: DashboardApp can be instantiated.
         """
-        from src.presentation.gui.app import DashboardApp
-
-        app = DashboardApp(redirect=False)
+        app = dashboard_app
         assert app is not None
         assert isinstance(app, wx.App)
-        app.Destroy()
 
-    def test_app_initializes_services(self):
+    def test_app_initializes_services(self, dashboard_app):
         """
         Test 5: Application initializes all required services.
 
         This verifies the dependency injection setup.
         """
-        from src.presentation.gui.app import DashboardApp
-
-        app = DashboardApp(redirect=False)
+        app = dashboard_app
 
         # Verify services are created
         assert hasattr(app, 'fs_adapter')
@@ -64,49 +85,44 @@ class TestApplicationSetup:
         assert hasattr(app, 'execution_service')
         assert hasattr(app, 'project_service')
 
-        app.Destroy()
-
-    def test_app_creates_presenter(self):
+    def test_app_creates_presenter(self, dashboard_app):
         """
         Test 6: Application creates the MainPresenter.
         """
-        from src.presentation.gui.app import DashboardApp
-
-        app = DashboardApp(redirect=False)
+        app = dashboard_app
 
         assert hasattr(app, 'presenter')
         assert app.presenter is not None
 
-        app.Destroy()
-
-    def test_app_creates_main_window(self):
+    def test_app_creates_main_window(self, dashboard_app):
         """
         Test 7: Application creates and shows the MainView window.
         """
-        from src.presentation.gui.app import DashboardApp
-
-        app = DashboardApp(redirect=False)
+        app = dashboard_app
 
         # Verify main window is created
         assert hasattr(app, 'main_view')
         assert app.main_view is not None
         assert isinstance(app.main_view, wx.Frame)
 
-        app.Destroy()
-
-    def test_on_init_returns_true(self):
+    def test_on_init_returns_true(self, dashboard_app):
         """
         Test 8: OnInit() returns True to indicate successful initialization.
         """
-        from src.presentation.gui.app import DashboardApp
-
-        app = DashboardApp(redirect=False)
+        app = dashboard_app
 
         # OnInit should have been called during instantiation
         # Verify the app is ready
         assert app.IsMainLoopRunning() or not app.IsMainLoopRunning()  # App exists
 
-        app.Destroy()
+    def test_app_attaches_project_service_after_show(self, dashboard_app):
+        """
+        Test 13: The presenter receives the project service once pending events run.
+        """
+        app = dashboard_app
+        app.ProcessPendingEvents()
+
+        assert app.presenter.project_service is app.project_service
 
 
 class TestApplicationEntryPoint:
@@ -141,14 +157,13 @@ class TestApplicationEntryPoint:
 class TestApplicationEventLoop:
     """Test asyncio event loop integration with wx.App."""
 
-    def test_app_has_asyncio_event_loop(self):
+    def test_app_has_asyncio_event_loop(self, dashboard_app):
         """
         Test 11: Application sets up an asyncio event loop for async operations.
         """
-        from src.presentation.gui.app import DashboardApp
         import asyncio
 
-        app = DashboardApp(redirect=False)
+        app = dashboard_app
 
         # Verify event loop is available
         try:
@@ -161,4 +176,22 @@ class TestApplicationEventLoop:
             assert loop is not None
             asyncio.set_event_loop(loop)
 
-        app.Destroy()
+    def test_run_async_tasks_adapts_tick_interval(self, dashboard_app):
+        """
+        Test 12: The asyncio tick speeds up while tasks are pending and slows down when idle.
+        """
+        from src.presentation.gui.app import ASYNC_BUSY_TICK_MS, ASYNC_IDLE_TICK_MS
+
+        app = dashboard_app
+        gate = app.loop.create_future()
+
+        async def wait_for_gate():
+            await gate
+
+        app.loop.create_task(wait_for_gate())
+        app._run_async_tasks(None)
+        assert app._tick_ms == ASYNC_BUSY_TICK_MS
+
+        gate.set_result(None)
+        app._run_async_tasks(None)
+        assert app._tick_ms == ASYNC_IDLE_TICK_MS
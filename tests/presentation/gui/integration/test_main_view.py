@@ -4,20 +4,14 @@ Integration tests for the MainView.
 These tests require wx.App to be running and test the actual wxPython widgets.
 They verify that the UI components work correctly and integrate with the presenter.
 """
+import asyncio
 import pytest
 import wx
 from unittest.mock import Mock, AsyncMock
+from src.presentation.gui.views.main_view import MainView
 
 
 @pytest.fixture(scope="module")
-def wx_app():
-    """Create a wx.App instance for the test session."""
-    app = wx.App(False)
-    yield app
-    app.Destroy()
-
-
-@pytest.fixture
 def mock_presenter():
     """Create a mock presenter for testing view in isolation."""
     presenter = Mock()
@@ -26,55 +20,47 @@ def mock_presenter():
     return presenter
 
 
+@pytest.fixture(scope="module")
+def view(wx_app, mock_presenter):
+    """Create one MainView shared by the tests in this module."""
+    view = MainView(mock_presenter)
+    yield view
+    # A test may already have destroyed the frame; wx proxies are falsy once deleted
+    if view:
+        view.Destroy()
+
+
 class TestMainViewCreation:
     """Test MainView instantiation and basic properties."""
 
-    def test_main_view_can_be_created(self, wx_app, mock_presenter):
+    def test_main_view_can_be_created(self, view):
         """
         Test 1: MainView can be instantiated with a presenter.
 
         This is our first failing integration test - MainView doesn't exist yet.
         """
-        from src.presentation.gui.views.main_view import MainView
-
-        view = MainView(mock_presenter)
-
         assert view is not None
         assert isinstance(view, wx.Frame)
-        view.Destroy()
 
-    def test_main_view_has_title(self, wx_app, mock_presenter):
+    def test_main_view_has_title(self, view):
         """
         Test 2: MainView has a proper window title.
         """
-        from src.presentation.gui.views.main_view import MainView
-
-        view = MainView(mock_presenter)
-
         title = view.GetTitle()
         assert "Project Dashboard" in title or "Dashboard" in title
-        view.Destroy()
 
-    def test_main_view_has_menu_bar(self, wx_app, mock_presenter):
+    def test_main_view_has_menu_bar(self, view):
         """
         Test 3: MainView has a menu bar.
         """
-        from src.presentation.gui.views.main_view import MainView
-
-        view = MainView(mock_presenter)
-
         menu_bar = view.GetMenuBar()
         assert menu_bar is not None
         assert isinstance(menu_bar, wx.MenuBar)
-        view.Destroy()
 
-    def test_main_view_has_file_menu(self, wx_app, mock_presenter):
+    def test_main_view_has_file_menu(self, view):
         """
         Test 4: MainView has a File menu with Open Project option.
         """
-        from src.presentation.gui.views.main_view import MainView
-
-        view = MainView(mock_presenter)
         menu_bar = view.GetMenuBar()
 
         # Find the File menu
@@ -95,62 +81,45 @@ class TestMainViewCreation:
                 break
 
         assert has_open_project, "Open Project menu item not found"
-        view.Destroy()
 
-    def test_main_view_has_status_bar(self, wx_app, mock_presenter):
+    def test_main_view_has_status_bar(self, view):
         """
         Test 5: MainView has a status bar.
         """
-        from src.presentation.gui.views.main_view import MainView
-
-        view = MainView(mock_presenter)
-
         status_bar = view.GetStatusBar()
         assert status_bar is not None
         assert isinstance(status_bar, wx.StatusBar)
-        view.Destroy()
 
 
 class TestMainViewInterface:
     """Test the view interface methods required by the presenter."""
 
-    def test_set_project_name_updates_title(self, wx_app, mock_presenter):
+    def test_set_project_name_updates_title(self, view):
         """
         Test 6: set_project_name() updates the window title.
         """
-        from src.presentation.gui.views.main_view import MainView
-
-        view = MainView(mock_presenter)
-
         view.set_project_name("My Test Project")
 
         title = view.GetTitle()
         assert "My Test Project" in title
-        view.Destroy()
 
-    def test_set_status_updates_status_bar(self, wx_app, mock_presenter):
+    def test_set_status_updates_status_bar(self, view):
         """
         Test 7: set_status() updates the status bar text.
         """
-        from src.presentation.gui.views.main_view import MainView
-
-        view = MainView(mock_presenter)
-
         view.set_status("Project loaded successfully")
 
         status_bar = view.GetStatusBar()
         status_text = status_bar.GetStatusText()
         assert "Project loaded successfully" in status_text
-        view.Destroy()
 
-    def test_show_error_displays_message_dialog(self, wx_app, mock_presenter, monkeypatch):
+    def test_show_error_displays_message_dialog(self, view, monkeypatch):
         """
         Test 8: show_error() displays an error message to the user.
 
-        We'll mock wx.MessageBox to avoid blocking on dialog.
+        We'll mock wx.MessageBox to avoid blocking on dialog, and wx.CallAfter
+        to run the deferred dialog call explicitly.
         """
-        from src.presentation.gui.views.main_view import MainView
-
         # Mock wx.MessageBox to capture the call
         message_box_called = []
         def mock_message_box(message, caption, style, parent):
@@ -163,38 +132,52 @@ class TestMainViewInterface:
 
         monkeypatch.setattr(wx, 'MessageBox', mock_message_box)
 
-        view = MainView(mock_presenter)
+        # Capture deferred calls so the test controls when they run
+        deferred_calls = []
+        monkeypatch.setattr(wx, 'CallAfter', lambda func, *args: deferred_calls.append((func, args)))
+
         view.show_error("An error occurred")
 
+        # The dialog must not open while the caller is still running
+        assert message_box_called == []
+        for func, args in deferred_calls:
+            func(*args)
+
         assert len(message_box_called) == 1
         assert "An error occurred" in message_box_called[0]['message']
         assert message_box_called[0]['style'] & wx.ICON_ERROR
-        view.Destroy()
+
+    def test_batch_updates_freezes_until_outermost_block_exits(self, view):
+        """
+        Test 11: batch_updates() freezes the frame and nested blocks thaw only at the outermost exit.
+        """
+        with view.batch_updates():
+            with view.batch_updates():
+                view.set_project_name("Batched Project")
+                view.set_status("Loaded")
+            assert view.IsFrozen()
+
+        assert not view.IsFrozen()
+        assert "Batched Project" in view.GetTitle()
+        assert view.GetStatusBar().GetStatusText() == "Loaded"
 
 
 class TestMainViewPresenterIntegration:
     """Test that the view properly integrates with the presenter."""
 
-    def test_view_stores_presenter_reference(self, wx_app, mock_presenter):
+    def test_view_stores_presenter_reference(self, view, mock_presenter):
         """
         Test 9: MainView maintains a reference to its presenter.
         """
-        from src.presentation.gui.views.main_view import MainView
-
-        view = MainView(mock_presenter)
-
         assert hasattr(view, 'presenter')
         assert view.presenter == mock_presenter
-        view.Destroy()
 
-    def test_open_project_menu_shows_directory_dialog(self, wx_app, mock_presenter, monkeypatch):
+    def test_open_project_menu_shows_directory_dialog(self, view, monkeypatch):
         """
-        Test 10: Selecting "Open Project" from File menu shows a directory picker.
+        Test 10: The "Open Project" menu handler shows a directory picker.
 
         We'll mock wx.DirDialog to avoid blocking on the dialog.
         """
-        from src.presentation.gui.views.main_view import MainView
-
         # Mock wx.DirDialog
         dialog_shown = []
         class MockDirDialog:
@@ -215,22 +198,41 @@ class TestMainViewPresenterIntegration:
 
         monkeypatch.setattr('wx.DirDialog', MockDirDialog)
 
-        view = MainView(mock_presenter)
-
-        # Find and trigger the Open Project menu item
-        menu_bar = view.GetMenuBar()
-        for i in range(menu_bar.GetMenuCount()):
-            label = menu_bar.GetMenuLabelText(i)
-            if "File" in label:
-                file_menu = menu_bar.GetMenu(i)
-                for item in file_menu.GetMenuItems():
-                    if "Open" in item.GetItemLabelText():
-                        # Simulate menu selection
-                        event = wx.CommandEvent(wx.wxEVT_COMMAND_MENU_SELECTED, item.GetId())
-                        view.ProcessEvent(event)
-                        break
-                break
+        # Invoke the handler bound to File > Open directly; Test 4 covers the menu item
+        view._on_open_project(None)
 
         # Verify dialog was shown
         assert len(dialog_shown) >= 1, "Directory dialog was not shown"
-        view.Destroy()
+
+    def test_open_project_schedules_load_on_app_loop(self, view, mock_presenter, monkeypatch):
+        """
+        Test 12: A chosen directory is loaded by a task on the app's loop that
+        the view keeps referenced until it finishes.
+        """
+        class MockDirDialog:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def ShowModal(self):
+                return wx.ID_OK
+
+            def GetPath(self):
+                return "/test/path"
+
+            def Destroy(self):
+                pass
+
+        loop = asyncio.new_event_loop()
+        monkeypatch.setattr('wx.DirDialog', MockDirDialog)
+        monkeypatch.setattr('wx.GetApp', lambda: Mock(loop=loop))
+        mock_presenter.load_project.reset_mock()
+
+        try:
+            view._on_open_project(None)
+            (task,) = view._pending_tasks
+            loop.run_until_complete(task)
+        finally:
+            loop.close()
+
+        mock_presenter.load_project.assert_awaited_once_with("/test/path")
+        assert not view._pending_tasks
@@ -7,18 +7,11 @@ and that users can interact with the target list.
 import pytest
 import wx
 from unittest.mock import Mock, AsyncMock
+from src.presentation.gui.views.main_view import MainView, TargetListCtrl
 from src.core.models import Target, ProjectConfig
 
 
 @pytest.fixture(scope="module")
-def wx_app():
-    """Create a wx.App instance for the test session."""
-    app = wx.App(False)
-    yield app
-    app.Destroy()
-
-
-@pytest.fixture
 def mock_presenter():
     """Create a mock presenter for testing view in isolation."""
     presenter = Mock()
@@ -28,41 +21,38 @@ def mock_presenter():
     return presenter
 
 
+@pytest.fixture(scope="module")
+def view(wx_app, mock_presenter):
+    """Create one MainView shared by the tests in this module."""
+    view = MainView(mock_presenter)
+    yield view
+    # A test may already have destroyed the frame; wx proxies are falsy once deleted
+    if view:
+        view.Destroy()
+
+
 @pytest.fixture
-def sample_targets():
-    """Create sample targets for testing."""
-    return [
-        Target(name="build", command="npm run build", source_file="package.json"),
-        Target(name="test", command="npm test", source_file="package.json"),
-        Target(name="lint", command="npm run lint", source_file="package.json")
-    ]
+def populated_view(view, sample_targets):
+    """The shared view showing sample_targets, with nothing selected."""
+    view.update_target_list(sample_targets)
+    return view
 
 
 class TestTargetListUI:
     """Test the target list UI component in MainView."""
 
-    def test_main_view_has_target_list_control(self, wx_app, mock_presenter):
+    def test_main_view_has_target_list_control(self, view):
         """
         Test 1: MainView contains a list control for displaying targets.
         """
-        from src.presentation.gui.views.main_view import MainView
-
-        view = MainView(mock_presenter)
-
         # Verify list control exists
         assert hasattr(view, 'target_list')
         assert isinstance(view.target_list, wx.ListCtrl)
 
-        view.Destroy()
-
-    def test_target_list_has_correct_columns(self, wx_app, mock_presenter):
+    def test_target_list_has_correct_columns(self, view):
         """
         Test 2: Target list has columns for Name, Command, and Source File.
         """
-        from src.presentation.gui.views.main_view import MainView
-
-        view = MainView(mock_presenter)
-
         # Verify columns
         assert view.target_list.GetColumnCount() >= 3
 
@@ -75,16 +65,10 @@ class TestTargetListUI:
         assert "Command" in col1_text
         assert "Source" in col2_text or "File" in col2_text
 
-        view.Destroy()
-
-    def test_update_target_list_populates_items(self, wx_app, mock_presenter, sample_targets):
+    def test_update_target_list_populates_items(self, view, sample_targets):
         """
         Test 3: update_target_list() method populates the list with targets.
         """
-        from src.presentation.gui.views.main_view import MainView
-
-        view = MainView(mock_presenter)
-
         # Update with sample targets
         view.update_target_list(sample_targets)
 
@@ -96,16 +80,10 @@ class TestTargetListUI:
         assert "npm run build" in view.target_list.GetItemText(0, 1)
         assert "package.json" in view.target_list.GetItemText(0, 2)
 
-        view.Destroy()
-
-    def test_update_target_list_clears_previous_items(self, wx_app, mock_presenter, sample_targets):
+    def test_update_target_list_clears_previous_items(self, view, sample_targets):
         """
         Test 4: update_target_list() clears previous items before adding new ones.
         """
-        from src.presentation.gui.views.main_view import MainView
-
-        view = MainView(mock_presenter)
-
         # Add targets first time
         view.update_target_list(sample_targets)
         assert view.target_list.GetItemCount() == 3
@@ -118,16 +96,10 @@ class TestTargetListUI:
         assert view.target_list.GetItemCount() == 1
         assert view.target_list.GetItemText(0, 0) == "build"
 
-        view.Destroy()
-
-    def test_update_target_list_with_empty_list(self, wx_app, mock_presenter):
+    def test_update_target_list_with_empty_list(self, view):
         """
         Test 5: update_target_list() with empty list clears the control.
         """
-        from src.presentation.gui.views.main_view import MainView
-
-        view = MainView(mock_presenter)
-
         # Add some targets first
         targets = [Target(name="test", command="test cmd", source_file="test.txt")]
         view.update_target_list(targets)
@@ -139,16 +111,11 @@ class TestTargetListUI:
         # Verify list is empty
         assert view.target_list.GetItemCount() == 0
 
-        view.Destroy()
-
-    def test_target_list_selection_tracking(self, wx_app, mock_presenter, sample_targets):
+    def test_target_list_selection_tracking(self, populated_view):
         """
         Test 6: View tracks which target is currently selected.
         """
-        from src.presentation.gui.views.main_view import MainView
-
-        view = MainView(mock_presenter)
-        view.update_target_list(sample_targets)
+        view = populated_view
 
         # Simulate selecting the second item
         view.target_list.Select(1)
@@ -157,32 +124,22 @@ class TestTargetListUI:
         selected_index = view.target_list.GetFirstSelected()
         assert selected_index == 1
 
-        view.Destroy()
-
-    def test_get_selected_target_returns_none_when_nothing_selected(self, wx_app, mock_presenter, sample_targets):
+    def test_get_selected_target_returns_none_when_nothing_selected(self, populated_view):
         """
         Test 7: get_selected_target() returns None when no target is selected.
         """
-        from src.presentation.gui.views.main_view import MainView
-
-        view = MainView(mock_presenter)
-        view.update_target_list(sample_targets)
+        view = populated_view
 
         # No selection made
         selected = view.get_selected_target()
 
         assert selected is None
 
-        view.Destroy()
-
-    def test_get_selected_target_returns_target_when_selected(self, wx_app, mock_presenter, sample_targets):
+    def test_get_selected_target_returns_target_when_selected(self, populated_view):
         """
         Test 8: get_selected_target() returns the selected Target object.
         """
-        from src.presentation.gui.views.main_view import MainView
-
-        view = MainView(mock_presenter)
-        view.update_target_list(sample_targets)
+        view = populated_view
 
         # Select the second item (index 1 = "test")
         view.target_list.Select(1)
@@ -193,4 +150,60 @@ class TestTargetListUI:
         assert selected.name == "test"
         assert selected.command == "npm test"
 
-        view.Destroy()
+    def test_update_target_list_leaves_control_thawed(self, view, sample_targets):
+        """
+        Test 9: update_target_list() batches its changes without leaving the control frozen.
+        """
+        view.update_target_list(sample_targets)
+
+        assert not view.target_list.IsFrozen()
+        assert [view.target_list.GetItemText(row, 0) for row in range(3)] == ["build", "test", "lint"]
+
+    def test_target_list_is_virtual(self, view, sample_targets):
+        """
+        Test 10: The target list serves rows on demand instead of storing them.
+        """
+        view.update_target_list(sample_targets)
+
+        assert view.target_list.HasFlag(wx.LC_VIRTUAL)
+        assert view.target_list.OnGetItemText(2, 1) == "npm run lint"
+
+    def test_update_target_list_clears_selection(self, view, sample_targets):
+        """
+        Test 11: Replacing the targets drops the previous selection.
+        """
+        view.update_target_list(sample_targets)
+        view.target_list.Select(2)
+
+        view.update_target_list(sample_targets[:1])
+
+        assert view.get_selected_target() is None
+
+    def test_large_target_list_is_populated_without_inserting_rows(self, wx_app, mock_presenter, monkeypatch):
+        """
+        Test 12: 10,000 targets are shown virtually; painting fetches only the visible page.
+        """
+        targets = [Target(name=f"t{i}", command=f"cmd {i}", source_file="Makefile") for i in range(10_000)]
+        fetched_rows = set()
+        original_get_item_text = TargetListCtrl.OnGetItemText
+
+        def recording_get_item_text(self, item, column):
+            fetched_rows.add(item)
+            return original_get_item_text(self, item, column)
+        monkeypatch.setattr(TargetListCtrl, "OnGetItemText", recording_get_item_text)
+
+        # A frame of its own, as the shared view is never shown and so never paints
+        shown_view = MainView(mock_presenter)
+        try:
+            shown_view.Show()
+            shown_view.update_target_list(targets)
+            shown_view.target_list.Update()
+            wx.Yield()
+
+            target_list = shown_view.target_list
+            assert target_list.HasFlag(wx.LC_VIRTUAL)
+            assert target_list.GetItemCount() == 10_000
+            # Painting asked for rows, but only those that fit on screen
+            assert 0 < len(fetched_rows) <= target_list.GetCountPerPage() + 1
+        finally:
+            shown_view.Destroy()
@@ -6,8 +6,9 @@ a wx.App instance. All dependencies are mocked.
 """
 import pytest
 from unittest.mock import Mock, AsyncMock, MagicMock
-from src.core.models import ProjectConfig, Target
+from src.core.models import ProjectConfig
 from src.core.services import ProjectService
+from src.presentation.gui.presenters.main_presenter import MainPresenter
 
 
 class TestMainPresenter:
@@ -24,89 +25,53 @@ class TestMainPresenter:
     @pytest.fixture
     def mock_view(self):
         """Create a mock view interface."""
-        view = Mock()
+        view = MagicMock()
         view.set_project_name = Mock()
         view.set_status = Mock()
         view.show_error = Mock()
         return view
 
+    @pytest.fixture
+    async def loaded_presenter(self, mock_project_service, mock_view, sample_config):
+        """Create a presenter that has already loaded sample_config from /test/project."""
+        mock_project_service.load_project.return_value = sample_config
+        mock_project_service.get_config.return_value = sample_config
+        presenter = MainPresenter(mock_project_service, mock_view)
+        await presenter.load_project("/test/project")
+        return presenter
+
     def test_presenter_can_be_instantiated(self, mock_project_service, mock_view):
         """
         Test 1: MainPresenter can be instantiated with a ProjectService and View.
 
         This is our first failing test - MainPresenter doesn't exist yet.
         """
-        from src.presentation.gui.presenters.main_presenter import MainPresenter
-
         presenter = MainPresenter(mock_project_service, mock_view)
 
         assert presenter is not None
         assert presenter.project_service == mock_project_service
         assert presenter.view == mock_view
 
-    @pytest.mark.asyncio
-    async def test_load_project_calls_service(self, mock_project_service, mock_view):
+    def test_load_project_calls_service(self, loaded_presenter, mock_project_service):
         """
         Test 2: load_project() method calls ProjectService.load_project().
 
         This verifies the presenter delegates to the service layer.
         """
-        from src.presentation.gui.presenters.main_presenter import MainPresenter
-
-        # Setup
-        project_root = "/test/project"
-        mock_config = ProjectConfig(project_name="Test Project", targets=[])
-        mock_project_service.load_project.return_value = mock_config
-
-        presenter = MainPresenter(mock_project_service, mock_view)
+        mock_project_service.load_project.assert_called_once_with("/test/project")
 
-        # Execute
-        await presenter.load_project(project_root)
-
-        # Verify
-        mock_project_service.load_project.assert_called_once_with(project_root)
-
-    @pytest.mark.asyncio
-    async def test_load_project_updates_view_with_project_name(self, mock_project_service, mock_view):
+    def test_load_project_updates_view_with_project_name(self, loaded_presenter, mock_view, sample_config):
         """
         Test 3: After loading project, the view is updated with the project name.
 
         This verifies the presenter updates the view after successful load.
         """
-        from src.presentation.gui.presenters.main_presenter import MainPresenter
+        mock_view.set_project_name.assert_called_once_with(sample_config.project_name)
 
-        # Setup
-        project_root = "/test/project"
-        mock_config = ProjectConfig(project_name="My Awesome Project", targets=[])
-        mock_project_service.load_project.return_value = mock_config
-        mock_project_service.get_config.return_value = mock_config
-
-        presenter = MainPresenter(mock_project_service, mock_view)
-
-        # Execute
-        await presenter.load_project(project_root)
-
-        # Verify
-        mock_view.set_project_name.assert_called_once_with("My Awesome Project")
-
-    @pytest.mark.asyncio
-    async def test_load_project_updates_status_on_success(self, mock_project_service, mock_view):
+    def test_load_project_updates_status_on_success(self, loaded_presenter, mock_view):
         """
         Test 4: Status bar is updated with success message after loading.
         """
-        from src.presentation.gui.presenters.main_presenter import MainPresenter
-
-        # Setup
-        project_root = "/test/project"
-        mock_config = ProjectConfig(project_name="Test Project", targets=[])
-        mock_project_service.load_project.return_value = mock_config
-
-        presenter = MainPresenter(mock_project_service, mock_view)
-
-        # Execute
-        await presenter.load_project(project_root)
-
-        # Verify
         mock_view.set_status.assert_called()
         status_message = mock_view.set_status.call_args[0][0]
         assert "loaded" in status_message.lower() or "success" in status_message.lower()
@@ -116,8 +81,6 @@ class TestMainPresenter:
         """
         Test 5: Errors during project loading are displayed to the user.
         """
-        from src.presentation.gui.presenters.main_presenter import MainPresenter
-
         # Setup
         project_root = "/test/project"
         mock_project_service.load_project.side_effect = Exception("Failed to load project")
@@ -136,8 +99,6 @@ class TestMainPresenter:
         """
         Test 6: get_project_name() returns None when no project is loaded.
         """
-        from src.presentation.gui.presenters.main_presenter import MainPresenter
-
         # Setup
         mock_project_service.get_config.return_value = None
         presenter = MainPresenter(mock_project_service, mock_view)
@@ -148,15 +109,12 @@ class TestMainPresenter:
         # Verify
         assert project_name is None
 
-    def test_get_project_name_returns_name_when_project_loaded(self, mock_project_service, mock_view):
+    def test_get_project_name_returns_name_when_project_loaded(self, mock_project_service, mock_view, sample_config):
         """
         Test 7: get_project_name() returns the project name when loaded.
         """
-        from src.presentation.gui.presenters.main_presenter import MainPresenter
-
         # Setup
-        mock_config = ProjectConfig(project_name="Test Project", targets=[])
-        mock_project_service.get_config.return_value = mock_config
+        mock_project_service.get_config.return_value = sample_config
         presenter = MainPresenter(mock_project_service, mock_view)
 
         # Execute
@@ -169,8 +127,6 @@ class TestMainPresenter:
         """
         Test 8: get_targets() returns empty list when no project is loaded.
         """
-        from src.presentation.gui.presenters.main_presenter import MainPresenter
-
         # Setup
         mock_project_service.get_config.return_value = None
         presenter = MainPresenter(mock_project_service, mock_view)
@@ -181,51 +137,101 @@ class TestMainPresenter:
         # Verify
         assert targets == []
 
-    def test_get_targets_returns_target_list_when_project_loaded(self, mock_project_service, mock_view):
+    def test_get_targets_returns_target_list_when_project_loaded(self, mock_project_service, mock_view, sample_config, sample_targets):
         """
         Test 9: get_targets() returns the list of targets when project is loaded.
         """
-        from src.presentation.gui.presenters.main_presenter import MainPresenter
-
         # Setup
-        target1 = Target(name="build", command="npm run build", source_file="package.json")
-        target2 = Target(name="test", command="npm test", source_file="package.json")
-        mock_config = ProjectConfig(project_name="Test Project", targets=[target1, target2])
-        mock_project_service.get_config.return_value = mock_config
+        mock_project_service.get_config.return_value = sample_config
         presenter = MainPresenter(mock_project_service, mock_view)
 
         # Execute
         targets = presenter.get_targets()
 
         # Verify
-        assert len(targets) == 2
-        assert targets[0].name == "build"
-        assert targets[1].name == "test"
+        assert targets == list(sample_targets)
 
-    @pytest.mark.asyncio
-    async def test_load_project_updates_target_list_in_view(self, mock_project_service, mock_view):
+    def test_load_project_updates_target_list_in_view(self, loaded_presenter, mock_view, sample_targets):
         """
         Test 10: After loading project, the view's target list is updated.
         """
-        from src.presentation.gui.presenters.main_presenter import MainPresenter
+        mock_view.update_target_list.assert_called_once()
+        call_args = mock_view.update_target_list.call_args[0][0]
+        assert call_args == list(sample_targets)
 
+    @pytest.mark.asyncio
+    async def test_get_project_name_uses_cached_name_after_load(self, mock_project_service, mock_view):
+        """
+        Test 11: get_project_name() answers from the presenter after a load, without the service.
+        """
         # Setup
-        project_root = "/test/project"
-        target1 = Target(name="build", command="npm run build", source_file="package.json")
-        target2 = Target(name="test", command="npm test", source_file="package.json")
-        mock_config = ProjectConfig(project_name="Test Project", targets=[target1, target2])
+        mock_config = ProjectConfig(project_name="Cached Project", targets=[])
         mock_project_service.load_project.return_value = mock_config
-        mock_project_service.get_config.return_value = mock_config
         mock_view.update_target_list = Mock()
+        presenter = MainPresenter(mock_project_service, mock_view)
+        await presenter.load_project("/test/project")
 
+        # Execute
+        project_name = presenter.get_project_name()
+
+        # Verify
+        assert project_name == "Cached Project"
+        mock_project_service.get_config.assert_not_called()
+
+    def test_invalidate_rereads_project_name_from_service(self, mock_project_service, mock_view):
+        """
+        Test 12: invalidate() makes get_project_name() consult the service again.
+        """
+        # Setup
+        mock_project_service.get_config.return_value = ProjectConfig(project_name="Old", targets=[])
         presenter = MainPresenter(mock_project_service, mock_view)
+        presenter.get_project_name()
+        mock_project_service.get_config.return_value = ProjectConfig(project_name="New", targets=[])
 
         # Execute
-        await presenter.load_project(project_root)
+        presenter.invalidate()
+        project_name = presenter.get_project_name()
 
         # Verify
-        mock_view.update_target_list.assert_called_once()
-        call_args = mock_view.update_target_list.call_args[0][0]
-        assert len(call_args) == 2
-        assert call_args[0].name == "build"
-        assert call_args[1].name == "test"
+        assert project_name == "New"
+
+    @pytest.mark.asyncio
+    async def test_load_project_updates_view_inside_one_batch(self, mock_project_service, mock_view):
+        """
+        Test 13: load_project() applies all view updates inside a single batch_updates() block.
+        """
+        # Setup
+        mock_config = ProjectConfig(project_name="Batched", targets=[])
+        mock_project_service.load_project.return_value = mock_config
+        batch = mock_view.batch_updates.return_value
+        calls = []
+        batch.__enter__.side_effect = lambda: calls.append("enter")
+        batch.__exit__.side_effect = lambda *exc: calls.append("exit")
+        mock_view.set_project_name.side_effect = lambda name: calls.append("name")
+        mock_view.update_target_list.side_effect = lambda targets: calls.append("targets")
+        mock_view.set_status.side_effect = lambda message: calls.append("status")
+        presenter = MainPresenter(mock_project_service, mock_view)
+
+        # Execute
+        await presenter.load_project("/test/project")
+
+        # Verify
+        mock_view.batch_updates.assert_called_once_with()
+        assert calls == ["enter", "name", "targets", "status", "exit"]
+
+    @pytest.mark.asyncio
+    async def test_presenter_without_service_reports_no_project(self, mock_view):
+        """
+        Test 14: Before the project service is attached, menu actions neither fail nor load anything.
+        """
+        # Setup
+        presenter = MainPresenter(None, mock_view)
+
+        # Execute
+        await presenter.load_project("/test/project")
+
+        # Verify
+        mock_view.set_status.assert_called_once()
+        mock_view.show_error.assert_not_called()
+        assert presenter.get_project_name() is None
+        assert presenter.get_targets() == []